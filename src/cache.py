@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Project-level cache root (git-ignored). Safe to delete at any time.
+CACHE_ROOT = Path(__file__).resolve().parents[1] / ".cache"
+
+
+class FileCache:
+    """Small JSON file cache for slow, mostly-immutable network results.
+
+    Entries live at ``<root>/<namespace>/<name>_<hash>.json`` and expire after
+    ``ttl`` seconds (checked against the file mtime).
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def _path(self, namespace: str, name: str, params: Dict[str, Any]) -> Path:
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        digest = hashlib.md5(raw.encode("utf-8")).hexdigest()[:16]
+        safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in name) or "_"
+        return self.root / namespace / f"{safe}_{digest}.json"
+
+    def get(self, namespace: str, name: str, params: Dict[str, Any], *, ttl: float) -> Any | None:
+        p = self._path(namespace, name, params)
+        try:
+            if time.time() - p.stat().st_mtime > ttl:
+                return None
+            with open(p, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.info("cache read failed for %s: %s", p, e)
+            return None
+
+    def set(self, namespace: str, name: str, params: Dict[str, Any], value: Any) -> None:
+        p = self._path(namespace, name, params)
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(p.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f, ensure_ascii=False, default=str)
+                # Atomic swap: readers never observe a half-written entry.
+                os.replace(tmp, p)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except Exception as e:
+            logging.info("cache write failed for %s: %s", p, e)
+
+    def memoize(
+        self,
+        namespace: str,
+        *,
+        name: Callable[[Dict[str, Any]], str],
+        ttl: Callable[[Dict[str, Any]], float],
+        should_store: Callable[[Any, Dict[str, Any]], bool],
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Cache a function on its keyword arguments.
+
+        Positional arguments (e.g. a client module) are not part of the key.
+        Only results accepted by ``should_store(result, kwargs)`` are written,
+        so transient failures are retried on the next call.
+        """
+
+        def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key_name = name(kwargs)
+                hit = self.get(namespace, key_name, kwargs, ttl=ttl(kwargs))
+                if hit is not None:
+                    return hit
+                res = fn(*args, **kwargs)
+                if should_store(res, kwargs):
+                    self.set(namespace, key_name, kwargs, res)
+                return res
+
+            return wrapper
+
+        return deco
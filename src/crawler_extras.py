@@ -1,8 +1,21 @@
 from __future__ import annotations
 
-import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date as _date
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from .cache import CACHE_ROOT, FileCache
+from .utils import try_import_akshare
+
+# (module key, display title) for every extras module, in output order.
+MODULE_TITLES: Tuple[Tuple[str, str], ...] = (
+    ("inventory", "仓单/库存"),
+    ("spot_basis", "现货/基差"),
+    ("roll_yield", "展期收益率"),
+    ("positions_rank", "会员持仓/成交排名"),
+)
 
 
 def fetch_extras(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str) -> Dict[str, Any]:
@@ -16,137 +29,295 @@ def fetch_extras(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str) -> Dict
     variety = _infer_variety(symbol)
     symbol_name = (symbol.get("name") or "").strip()
     if not variety:
-        return {
-            "status": "unavailable",
-            "asof": date,
-            "modules": {
-                "inventory": _mod_unavailable("仓单/库存", "missing variety"),
-                "spot_basis": _mod_unavailable("现货/基差", "missing variety"),
-                "roll_yield": _mod_unavailable("展期收益率", "missing variety"),
-                "positions_rank": _mod_unavailable("会员持仓/成交排名", "missing variety"),
-            },
-        }
+        return _all_unavailable(date, "missing variety")
 
-    ak = _try_import_akshare()
+    ak = try_import_akshare()
     if ak is None:
-        return {
-            "status": "unavailable",
-            "asof": date,
-            "modules": {
-                "inventory": _mod_unavailable("仓单/库存", "akshare not installed"),
-                "spot_basis": _mod_unavailable("现货/基差", "akshare not installed"),
-                "roll_yield": _mod_unavailable("展期收益率", "akshare not installed"),
-                "positions_rank": _mod_unavailable("会员持仓/成交排名", "akshare not installed"),
-            },
-        }
+        return _all_unavailable(date, "akshare not installed")
 
     date_iso, date_compact = _resolve_asof_date(date)
 
-    modules: Dict[str, Any] = {}
-
-    # Inventory (Eastmoney) - often limited to certain varieties
-    modules["inventory"] = _fetch_inventory(ak, variety=variety, symbol_name=symbol_name)
-
-    # Spot & basis (needs trading date)
-    modules["spot_basis"] = _fetch_spot_basis(
-        ak, variety=variety, symbol_name=symbol_name, date_compact=date_compact
-    )
-
-    # Roll yield (needs trading date)
-    modules["roll_yield"] = _fetch_roll_yield(
-        ak, variety=variety, symbol_name=symbol_name, date_compact=date_compact
-    )
+    tasks: Dict[str, Callable[[], Dict[str, Any]]] = {
+        # Inventory (Eastmoney) - often limited to certain varieties
+        "inventory": lambda: _fetch_inventory(ak, variety=variety, symbol_name=symbol_name),
+        # Spot & basis (needs trading date)
+        "spot_basis": lambda: _fetch_spot_basis(
+            ak, variety=variety, symbol_name=symbol_name, date_compact=date_compact
+        ),
+        # Roll yield (needs trading date)
+        "roll_yield": lambda: _fetch_roll_yield(
+            ak, variety=variety, symbol_name=symbol_name, date_compact=date_compact
+        ),
+        # Positions rank (needs trading date)
+        "positions_rank": lambda: _fetch_positions_rank(ak, variety=variety, date_compact=date_compact),
+    }
 
-    # Positions rank (needs trading date)
-    modules["positions_rank"] = _fetch_positions_rank(ak, variety=variety, date_compact=date_compact)
+    # The modules are independent blocking HTTP calls; run them side by side so
+    # the total latency is roughly that of the slowest one.
+    modules: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=len(MODULE_TITLES)) as pool:
+        futures = {key: pool.submit(tasks[key]) for key, _ in MODULE_TITLES}
+        for key, title in MODULE_TITLES:
+            try:
+                modules[key] = futures[key].result()
+            except Exception as e:
+                modules[key] = _mod_unavailable(title, f"接口异常：{type(e).__name__}")
 
     overall = "ok" if any(m.get("status") == "ok" for m in modules.values()) else "unavailable"
     return {"status": overall, "asof": date_iso, "modules": modules}
 
 
-def _try_import_akshare():
-    try:
-        import akshare as ak  # type: ignore
-
-        return ak
-    except Exception as e:
-        logging.info("AKShare not available: %s", e)
-        return None
-
-
 def _infer_variety(symbol: Dict[str, Any]) -> str:
     # Prefer explicit override if provided
-    v = (symbol.get("variety") or "").strip()
+    v = (symbol.get("variety") or "").strip().upper()
     if v:
-        return v.upper()
-
+        return v
     ak_sym = (symbol.get("akshare_symbol") or "").strip().upper()
-    if ak_sym and ak_sym.endswith("0"):
-        return ak_sym[:-1]
-    if ak_sym:
-        return ak_sym
-    return ""
+    return ak_sym[:-1] if ak_sym.endswith("0") else ak_sym
 
 
-def _resolve_asof_date(date_iso: str) -> Tuple[str, str]:
-    # default: the provided date
+def _parse_ymd(s: str, *, dash: bool) -> _date | None:
+    # Fixed-layout fast path; strptime is only used for unusual input.
+    y, m, d = (s[0:4], s[5:7], s[8:10]) if dash else (s[0:4], s[4:6], s[6:8])
+    if len(s) == (10 if dash else 8) and y.isdigit() and m.isdigit() and d.isdigit():
+        if not dash or (s[4] == "-" and s[7] == "-"):
+            try:
+                return _date(int(y), int(m), int(d))
+            except ValueError:
+                return None
     try:
-        dt = datetime.strptime(date_iso, "%Y-%m-%d")
+        return datetime.strptime(s, "%Y-%m-%d" if dash else "%Y%m%d").date()
     except Exception:
+        return None
+
+
+def _compact(d: _date) -> str:
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
+
+def _resolve_asof_date(date_iso: str) -> Tuple[str, str]:
+    # default: the provided date
+    dt = _parse_ymd(date_iso, dash=True)
+    if dt is None:
         return date_iso, ""
 
     # If weekend, roll back to Friday
     while dt.weekday() >= 5:
         dt -= timedelta(days=1)
-    return dt.strftime("%Y-%m-%d"), dt.strftime("%Y%m%d")
+    return dt.isoformat(), _compact(dt)
 
 
-def _date_candidates(date_compact: str, *, max_lookback_days: int = 7) -> List[str]:
-    try:
-        dt = datetime.strptime(date_compact, "%Y%m%d")
-    except Exception:
-        return [date_compact] if date_compact else []
+@functools.lru_cache(maxsize=128)
+def _date_candidates(date_compact: str, *, max_lookback_days: int = 7) -> Tuple[str, ...]:
+    # Cached: all four modules walk the same candidates for a given as-of date.
+    dt = _parse_ymd(date_compact, dash=False)
+    if dt is None:
+        return (date_compact,) if date_compact else ()
 
-    out = []
-    for i in range(0, max_lookback_days + 1):
-        out.append((dt - timedelta(days=i)).strftime("%Y%m%d"))
-    return out
+    return tuple(_compact(dt - timedelta(days=i)) for i in range(0, max_lookback_days + 1))
 
 
 def _mod_unavailable(title: str, reason: str) -> Dict[str, Any]:
     return {"status": "unavailable", "hint": f"{title}（{reason}）", "items": []}
 
 
-def _to_records(df: Any) -> List[Dict[str, Any]]:
+def _unavailable_modules(reason: str) -> Dict[str, Dict[str, Any]]:
+    return {key: _mod_unavailable(title, reason) for key, title in MODULE_TITLES}
+
+
+# Prebuilt per early-exit reason; the returned payloads are read-only downstream.
+_UNAVAILABLE_MODULES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    reason: _unavailable_modules(reason)
+    for reason in ("missing variety", "not a futures symbol", "unsupported variety", "akshare not installed")
+}
+
+
+def _all_unavailable(date: str, reason: str) -> Dict[str, Any]:
+    modules = _UNAVAILABLE_MODULES.get(reason) or _unavailable_modules(reason)
+    return {"status": "unavailable", "asof": date, "modules": modules}
+
+
+def _to_records(df: Any, *, tail: int | None = None) -> List[Dict[str, Any]]:
     if df is None:
         return []
     try:
+        if tail is not None:
+            # Slice the frame before converting so only the needed rows become dicts.
+            df = df.tail(tail)
         return list(df.to_dict("records"))
     except Exception:
         return []
 
 
+def _iter_records(df: Any) -> Iterator[Dict[str, Any]]:
+    """Yield rows lazily so callers that stop at the first match skip the rest."""
+    if df is None:
+        return
+    try:
+        cols = list(df.columns)
+        rows = df.itertuples(index=False, name=None)
+    except Exception:
+        yield from _to_records(df)
+        return
+    for row in rows:
+        yield dict(zip(cols, row))
+
+
+_WS_TABLE = str.maketrans("", "", " \t\r\n\u3000")
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_text_str(s: str) -> str:
+    return s.translate(_WS_TABLE).upper()
+
+
 def _norm_text(s: Any) -> str:
     if s is None:
         return ""
-    t = str(s).strip().replace(" ", "").replace("\t", "")
-    return t.upper()
+    return _norm_text_str(str(s))
+
+
+_NUM_TABLE = str.maketrans("", "", ", \t\r\n")
+_NUM_NA = frozenset({"", "nan", "None", "NaN", "--", "-"})
 
 
 def _num(v: Any) -> float | None:
     if v is None:
         return None
     if isinstance(v, (int, float)):
-        return float(v)
-    s = str(v).strip().replace(",", "")
-    if s in {"", "nan", "None"}:
+        x = float(v)
+        return None if x != x else x  # NaN
+    if not isinstance(v, str):
+        # numpy scalars, Decimal, ...: convert directly, skipping the str() round trip.
+        try:
+            x = float(v)
+            return None if x != x else x
+        except Exception:
+            pass
+    s = str(v).translate(_NUM_TABLE)
+    if s in _NUM_NA:
         return None
     try:
-        return float(s)
+        x = float(s)
+        return None if x != x else x
     except Exception:
         return None
 
 
+def _first_value(row: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    for k in keys:
+        v = row.get(k)
+        if v is not None:
+            return v
+    return None
+
+
+# (output field, source column aliases, converter) for futures_spot_price rows.
+_SPOT_FIELDS: Tuple[Tuple[str, Tuple[str, ...], Any], ...] = (
+    ("spot_price", ("spot_price", "现货价格"), _num),
+    ("near_contract", ("near_contract", "最近交割合约"), None),
+    ("near_contract_price", ("near_contract_price", "最近交割合约价格"), _num),
+    ("dom_contract", ("dom_contract", "主力合约"), None),
+    ("dom_contract_price", ("dom_contract_price", "主力合约价格"), _num),
+    ("near_basis", ("near_basis", "最近合约基差值"), _num),
+    ("dom_basis", ("dom_basis", "主力合约基差值"), _num),
+    ("near_basis_rate", ("near_basis_rate", "最近合约基差率"), _num),
+    ("dom_basis_rate", ("dom_basis_rate", "主力合约基差率"), _num),
+)
+
+
+# (output field, source column aliases) for futures_inventory_em rows.
+_INVENTORY_DATE_KEYS = ("日期", "date")
+_INVENTORY_FIELDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("inventory", ("库存", "inventory")),
+    ("change", ("增减", "change")),
+)
+
+# Value column aliases when get_roll_yield returns a table.
+_ROLL_YIELD_KEYS = ("roll_yield", "ry", "展期收益率", "yield", "value")
+
+# Columns that identify the variety in futures_spot_price tables.
+_SPOT_KEY_COLUMNS = ("symbol", "品种", "品种名称", "品种名", "var", "VAR", "代码", "品种代码")
+
+
+def _text_matches(c_norm: str, targets: set[str]) -> bool:
+    # Support exact and fuzzy contains matching.
+    return any(c_norm == t or (t in c_norm) or (c_norm in t) for t in targets)
+
+
+def _find_target_record(recs: Iterable[Dict[str, Any]], targets: set[str]) -> Dict[str, Any] | None:
+    for r in recs:
+        candidates: List[Any] = [r.get(k) for k in _SPOT_KEY_COLUMNS if r.get(k) is not None]
+        if not candidates:
+            candidates = [v for v in r.values() if isinstance(v, str) and v.strip()]
+        for c in candidates:
+            c_norm = _norm_text(c)
+            if c_norm and _text_matches(c_norm, targets):
+                return r
+    return None
+
+
+def _find_target(df: Any, targets: set[str]) -> Dict[str, Any] | None:
+    """Return the first row of a spot-price table whose variety matches ``targets``.
+
+    Uses column-wise DataFrame string ops so only the matched row is turned
+    into a dict; falls back to a record scan for non-DataFrame inputs.
+    """
+    if df is None or not targets:
+        return None
+    try:
+        cols = [c for c in _SPOT_KEY_COLUMNS if c in df.columns]
+        if not cols:
+            cols = [c for c in df.columns if df[c].dtype.kind == "O"]
+        if not cols or len(df) == 0:
+            return None
+        mask = None
+        for c in cols:
+            col = df[c]
+            norm = col.astype(str).str.translate(_WS_TABLE).str.upper()
+            hit = norm.map(lambda v: isinstance(v, str) and bool(v) and _text_matches(v, targets)) & col.notna()
+            mask = hit if mask is None else (mask | hit)
+        recs = df.loc[mask].head(1).to_dict("records")
+        return recs[0] if recs else None
+    except AttributeError:
+        return _find_target_record(_iter_records(df), targets)
+
+
+_CACHE = FileCache(CACHE_ROOT / "extras")
+_CACHE_TTL_CURRENT = 24 * 3600
+_CACHE_TTL_PAST = 90 * 24 * 3600
+
+
+def _cache_name(kw: Dict[str, Any]) -> str:
+    return f"{kw.get('variety') or ''}_{kw.get('date_compact') or 'latest'}"
+
+
+def _is_past(date_compact: str) -> bool:
+    return bool(date_compact) and date_compact < datetime.now().strftime("%Y%m%d")
+
+
+def _cache_ttl(kw: Dict[str, Any]) -> float:
+    # Data for a closed past session does not change; today's may still update.
+    if _is_past(str(kw.get("date_compact") or "")):
+        return _CACHE_TTL_PAST
+    return _CACHE_TTL_CURRENT
+
+
+def _should_store(res: Any, kw: Dict[str, Any]) -> bool:
+    if not (isinstance(res, dict) and res.get("status") == "ok"):
+        return False
+    # A fallback to an earlier session is not pinned under today's key: the
+    # requested day's data may still be published later.
+    d = str(kw.get("date_compact") or "")
+    used = str((res.get("params") or {}).get("date") or "")
+    return not used or used == d or _is_past(d)
+
+
+def _cached(module: str):
+    return _CACHE.memoize(module, name=_cache_name, ttl=_cache_ttl, should_store=_should_store)
+
+
+@_cached("inventory")
 def _fetch_inventory(ak: Any, *, variety: str, symbol_name: str) -> Dict[str, Any]:
     last_exc: Exception | None = None
     candidates = []
@@ -158,21 +329,16 @@ def _fetch_inventory(ak: Any, *, variety: str, symbol_name: str) -> Dict[str, An
     for cand in candidates:
         try:
             df = ak.futures_inventory_em(symbol=cand)
-            recs = _to_records(df)
+            recs = _to_records(df, tail=60)
             items = []
-            for r in recs[-60:]:
-                d = r.get("日期") or r.get("date")
-                inv = _num(r.get("库存") or r.get("inventory"))
-                chg = _num(r.get("增减") or r.get("change"))
+            for r in recs:
+                d = _first_value(r, _INVENTORY_DATE_KEYS)
                 if not d:
                     continue
-                items.append(
-                    {
-                        "date": str(d).split(" ")[0].replace("/", "-"),
-                        "inventory": inv,
-                        "change": chg,
-                    }
-                )
+                item = {"date": str(d).split(" ")[0].replace("/", "-")}
+                for name, keys in _INVENTORY_FIELDS:
+                    item[name] = _num(_first_value(r, keys))
+                items.append(item)
             if not items:
                 continue
             last = items[-1]
@@ -197,100 +363,54 @@ def _fetch_inventory(ak: Any, *, variety: str, symbol_name: str) -> Dict[str, An
     return {"status": "empty", "hint": "仓单/库存（AKShare futures_inventory_em）", "items": []}
 
 
+@_cached("spot_basis")
 def _fetch_spot_basis(ak: Any, *, variety: str, symbol_name: str, date_compact: str) -> Dict[str, Any]:
     if not date_compact:
         return _mod_unavailable("现货/基差", "missing date")
-    last_exc: Exception | None = None
     targets = {_norm_text(variety), _norm_text(symbol_name)}
     targets.discard("")
-    try:
-        asof_dt = datetime.strptime(date_compact, "%Y%m%d").date()
-    except Exception:
-        asof_dt = None
-    def _find_target(recs: List[Dict[str, Any]]) -> Dict[str, Any] | None:
-        for r in recs:
-            candidates: List[Any] = []
-            for k in [
-                "symbol",
-                "品种",
-                "品种名称",
-                "品种名",
-                "var",
-                "VAR",
-                "代码",
-                "品种代码",
-            ]:
-                if k in r and r.get(k) is not None:
-                    candidates.append(r.get(k))
-            if not candidates:
-                for v in r.values():
-                    if isinstance(v, str) and v.strip():
-                        candidates.append(v)
-
-            for c in candidates:
-                c_norm = _norm_text(c)
-                if not c_norm:
-                    continue
-                for t in targets:
-                    if not t:
-                        continue
-                    # Support exact and fuzzy contains matching.
-                    if c_norm == t or (t in c_norm) or (c_norm in t):
-                        return r
-        return None
-
-    for d in _date_candidates(date_compact):
+    def _for_date(d: str) -> Dict[str, Any] | None:
+        # Prefer passing vars_list to avoid default filtering dropping some varieties,
+        # but if it yields no match, retry without vars_list to search the full table.
+        df_filtered = None
         try:
-            # Prefer passing vars_list to avoid default filtering dropping some varieties,
-            # but if it yields no match, retry without vars_list to search the full table.
+            df_filtered = ak.futures_spot_price(d, vars_list=[variety.strip().upper()])
+        except TypeError:
             df_filtered = None
-            try:
-                df_filtered = ak.futures_spot_price(d, vars_list=[variety.strip().upper()])
-            except TypeError:
-                df_filtered = None
-
-            if df_filtered is not None:
-                recs = _to_records(df_filtered)
-                target = _find_target(recs)
-                if target is None:
-                    # retry full table
-                    df_all = ak.futures_spot_price(d)
-                    target = _find_target(_to_records(df_all))
-            else:
+
+        if df_filtered is not None:
+            target = _find_target(df_filtered, targets)
+            if target is None:
+                # retry full table
                 df_all = ak.futures_spot_price(d)
-                target = _find_target(_to_records(df_all))
+                target = _find_target(df_all, targets)
+        else:
+            df_all = ak.futures_spot_price(d)
+            target = _find_target(df_all, targets)
 
-            if not target:
-                continue
+        if not target:
+            return None
 
-            item = {
-                "date": d,
-                "symbol": variety,
-                "spot_price": _num(target.get("spot_price") or target.get("现货价格")),
-                "near_contract": target.get("near_contract") or target.get("最近交割合约"),
-                "near_contract_price": _num(target.get("near_contract_price") or target.get("最近交割合约价格")),
-                "dom_contract": target.get("dom_contract") or target.get("主力合约"),
-                "dom_contract_price": _num(target.get("dom_contract_price") or target.get("主力合约价格")),
-                "near_basis": _num(target.get("near_basis") or target.get("最近合约基差值")),
-                "dom_basis": _num(target.get("dom_basis") or target.get("主力合约基差值")),
-                "near_basis_rate": _num(target.get("near_basis_rate") or target.get("最近合约基差率")),
-                "dom_basis_rate": _num(target.get("dom_basis_rate") or target.get("主力合约基差率")),
-            }
+        item: Dict[str, Any] = {"date": d, "symbol": variety}
+        for name, keys, conv in _SPOT_FIELDS:
+            v = _first_value(target, keys)
+            item[name] = conv(v) if conv else v
 
-            summary = None
-            if item.get("spot_price") is not None:
-                summary = f"现货 {item.get('spot_price')} · 主力基差 {item.get('dom_basis')}"
+        summary = None
+        if item.get("spot_price") is not None:
+            summary = f"现货 {item.get('spot_price')} · 主力基差 {item.get('dom_basis')}"
 
-            return {
-                "status": "ok",
-                "hint": "现货/基差（AKShare futures_spot_price）",
-                "summary": summary,
-                "items": [item],
-                "params": {"date": d},
-            }
-        except Exception as e:
-            last_exc = e
-            continue
+        return {
+            "status": "ok",
+            "hint": "现货/基差（AKShare futures_spot_price）",
+            "summary": summary,
+            "items": [item],
+            "params": {"date": d},
+        }
+
+    res, last_exc = _try_dates(_date_candidates(date_compact), _for_date)
+    if res is not None:
+        return res
 
     if last_exc is not None:
         msg = str(last_exc).strip()
@@ -309,73 +429,87 @@ def _fetch_spot_basis(ak: Any, *, variety: str, symbol_name: str, date_compact:
     }
 
 
-def _fetch_roll_yield(ak: Any, *, variety: str, symbol_name: str, date_compact: str) -> Dict[str, Any]:
-    if not date_compact:
-        return _mod_unavailable("展期收益率", "missing date")
+def _try_dates(
+    dates: Iterable[str], fn: Callable[[str], Dict[str, Any] | None]
+) -> Tuple[Dict[str, Any] | None, Exception | None]:
+    """Walk candidate trading dates newest-first.
+
+    Returns the first non-empty ``fn(d)`` result (or None) and the last error
+    raised along the way, which callers surface in their unavailable hint.
+    """
     last_exc: Exception | None = None
-    for d in _date_candidates(date_compact):
+    for d in dates:
         try:
-            res = None
-            # Some AKShare versions expect lowercase variety
-            for v in [
-                variety,
-                variety.lower(),
-                variety.strip(),
-                variety.strip().lower(),
-                symbol_name,
-                symbol_name.strip(),
-            ]:
-                if not v or not str(v).strip():
-                    continue
-                try:
-                    res = ak.get_roll_yield(date=d, var=v)
-                    break
-                except Exception as e:
-                    last_exc = e
-                    res = None
-
-            if not res:
-                continue
+            res = fn(d)
+        except Exception as e:
+            last_exc = e
+            continue
+        if res:
+            return res, last_exc
+    return None, last_exc
 
-            # AKShare returns (roll_yield, near_by, deferred) in many versions.
-            if isinstance(res, (tuple, list)) and len(res) >= 3:
-                ry, near_by, deferred = res[0], res[1], res[2]
-                ry_num = _num(ry)
-                item = {
-                    "date": d,
-                    "var": variety,
-                    "roll_yield": ry_num,
-                    "near_by": str(near_by),
-                    "deferred": str(deferred),
-                }
-                return {
-                    "status": "ok",
-                    "hint": "展期收益率（AKShare get_roll_yield）",
-                    "summary": f"展期收益率 {ry_num}",
-                    "items": [item],
-                    "params": {"date": d, "var": variety},
-                }
-
-            # Fallback: if a DataFrame-like is returned
-            recs = _to_records(res)
-            if not recs:
-                continue
-            r0 = recs[0]
-            val = None
-            for k in ["roll_yield", "ry", "展期收益率", "yield", "value"]:
-                if k in r0:
-                    val = _num(r0.get(k))
-                    break
+
+def _roll_yield_for_date(ak: Any, d: str, var_cands: List[str]) -> Tuple[Any, Exception | None]:
+    """Try each variety spelling for one date; stop at the first call that succeeds."""
+    last_exc: Exception | None = None
+    for v in var_cands:
+        try:
+            return ak.get_roll_yield(date=d, var=v), None
+        except Exception as e:
+            last_exc = e
+    return None, last_exc
+
+
+@_cached("roll_yield")
+def _fetch_roll_yield(ak: Any, *, variety: str, symbol_name: str, date_compact: str) -> Dict[str, Any]:
+    if not date_compact:
+        return _mod_unavailable("展期收益率", "missing date")
+    # Some AKShare versions expect lowercase variety. Dedupe the spellings so
+    # the common already-clean input does not repeat identical requests.
+    var_cands = list(dict.fromkeys(v.strip() for v in (variety, variety.lower(), symbol_name) if v and v.strip()))
+    def _for_date(d: str) -> Dict[str, Any] | None:
+        res, exc = _roll_yield_for_date(ak, d, var_cands)
+        if not res:
+            if exc is not None:
+                raise exc
+            return None
+
+        # AKShare returns (roll_yield, near_by, deferred) in many versions.
+        if isinstance(res, (tuple, list)) and len(res) >= 3:
+            ry, near_by, deferred = res[0], res[1], res[2]
+            ry_num = _num(ry)
+            item = {
+                "date": d,
+                "var": variety,
+                "roll_yield": ry_num,
+                "near_by": str(near_by),
+                "deferred": str(deferred),
+            }
             return {
                 "status": "ok",
                 "hint": "展期收益率（AKShare get_roll_yield）",
-                "summary": f"展期收益率 {val}" if val is not None else None,
-                "items": recs,
+                "summary": f"展期收益率 {ry_num}",
+                "items": [item],
                 "params": {"date": d, "var": variety},
             }
-        except Exception as e:
-            last_exc = e
-            continue
+
+        # Fallback: if a DataFrame-like is returned
+        recs = _to_records(res)
+        if not recs:
+            return None
+        r0 = recs[0]
+        val = _num(_first_value(r0, _ROLL_YIELD_KEYS))
+        return {
+            "status": "ok",
+            "hint": "展期收益率（AKShare get_roll_yield）",
+            "summary": f"展期收益率 {val}" if val is not None else None,
+            "items": recs,
+            "params": {"date": d, "var": variety},
+        }
+
+    res, last_exc = _try_dates(_date_candidates(date_compact), _for_date)
+    if res is not None:
+        return res
 
     if last_exc is not None:
         return {
@@ -392,27 +526,28 @@ def _fetch_roll_yield(ak: Any, *, variety: str, symbol_name: str, date_compact:
     }
 
 
+@_cached("positions_rank")
 def _fetch_positions_rank(ak: Any, *, variety: str, date_compact: str) -> Dict[str, Any]:
     if not date_compact:
         return _mod_unavailable("会员持仓/成交排名", "missing date")
-    last_exc: Exception | None = None
-    for d in _date_candidates(date_compact):
-        try:
-            df = ak.get_rank_sum_daily(start_day=d, end_day=d, vars_list=[variety])
-            recs = _to_records(df)
-            items = recs[:]
-            if not items:
-                continue
-            return {
-                "status": "ok",
-                "hint": "会员持仓/成交排名（AKShare get_rank_sum_daily）",
-                "summary": f"{len(items)} 条汇总记录",
-                "items": items,
-                "params": {"date": d, "var": variety},
-            }
-        except Exception as e:
-            last_exc = e
-            continue
+
+    def _for_date(d: str) -> Dict[str, Any] | None:
+        # _to_records already builds a fresh list; no defensive copy needed.
+        items = _to_records(ak.get_rank_sum_daily(start_day=d, end_day=d, vars_list=[variety]))
+        if not items:
+            return None
+        return {
+            "status": "ok",
+            "hint": "会员持仓/成交排名（AKShare get_rank_sum_daily）",
+            "summary": f"{len(items)} 条汇总记录",
+            "items": items,
+            "params": {"date": d, "var": variety},
+        }
+
+    # Newest-first, one day per request: the first candidate usually has data.
+    res, last_exc = _try_dates(_date_candidates(date_compact), _for_date)
+    if res is not None:
+        return res
 
     if last_exc is not None:
         return {
@@ -3,120 +3,170 @@ from __future__ import annotations
 from datetime import date as _date
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+import codecs
+import functools
+import heapq
+import html as _html
+import io
+import itertools
 import math
 import re
+import sys
+import threading
 import time
 import urllib.parse
-from html.parser import HTMLParser
-from typing import Any, Dict, List
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 
 import feedparser
-import requests
 
+from .cache import CACHE_ROOT, FileCache
 from .cleaner import clean_text
+from .http_client import get_session
+
+# lxml ships with the optional AKShare requirements; fall back to a regex scan.
+try:
+    import lxml.html as _lxml_html
+except Exception:
+    _lxml_html = None
+
+# Pages and feeds are fetched concurrently; this caps in-flight requests.
+_FETCH_WORKERS = 8
+# Portal pages mostly come from a handful of hosts; stay polite to each one.
+_PER_HOST_LIMIT = 2
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+# Decoded pages / parsed feeds. Within the fresh window they are served from
+# disk; after that they are revalidated with ETag/Last-Modified.
+_NET_CACHE = FileCache(CACHE_ROOT / "news")
+_NET_CACHE_FRESH_SECONDS = 5 * 60
+_NET_CACHE_KEEP_SECONDS = 7 * 24 * 3600
+# Google News results for a query barely move within the hour and every
+# symbol run repeats the same macro queries; override via news.gnews.cache_ttl.
+_GNEWS_CACHE_TTL = 3600
+_NET_MEMO: Dict[tuple[Any, ...], tuple[float, Any]] = {}
+
+_ANCHOR_RE = re.compile(r"<a\b[^>]*?\bhref\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))[^>]*>(.*?)</a\s*>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]*>")
+_META_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([a-z0-9_\-]+)")
+
+# Default article-link filters per web source (config `url_allow` overrides).
+_JIN10_ALLOW_RE = re.compile(r"xnews\.jin10\.com/(details|\d)")
+_EASTMONEY_ALLOW_RE = re.compile(r"eastmoney\.com/a/\d{16,}\.html")
+_QHRB_ALLOW_RE = re.compile(r"qhrb\.com\.cn")
+
+
+def _iter_anchors(html: str) -> Iterator[tuple[str, str]]:
+    """Yield raw (href, text) pairs for every <a href> in the page."""
+    if _lxml_html is not None:
+        try:
+            doc = _lxml_html.fromstring(html)
+        except Exception:
+            doc = None
+        if doc is not None:
+            for a in doc.iter("a"):
+                href = a.get("href")
+                if href:
+                    yield href, " ".join(a.itertext())
+            return
+    for m in _ANCHOR_RE.finditer(html):
+        href = m.group(1) or m.group(2) or m.group(3)
+        if href:
+            yield _html.unescape(href), _html.unescape(_TAG_RE.sub(" ", m.group(4)))
 
 
-class _AnchorParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self._in_a = False
-        self._href: str | None = None
-        self._buf: list[str] = []
-        self.anchors: list[dict[str, str]] = []
+_DEFAULT_UA = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36"
+)
 
-    def handle_starttag(self, tag: str, attrs):
-        if tag.lower() != "a":
-            return
-        href = None
-        for k, v in attrs:
-            if k.lower() == "href" and v:
-                href = str(v)
-                break
-        if not href:
-            return
-        self._in_a = True
-        self._href = href
-        self._buf = []
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_BOM_PREFIXES = tuple(bom for bom, _ in _BOMS)
+_READ_CHUNK = 64 * 1024
 
-    def handle_data(self, data: str):
-        if self._in_a and data:
-            self._buf.append(data)
 
-    def handle_endtag(self, tag: str):
-        if tag.lower() != "a":
-            return
-        if not self._in_a:
-            return
-        text = clean_text(" ".join(self._buf))
-        href = clean_text(self._href or "")
-        if text and href:
-            self.anchors.append({"title": text, "href": href})
-        self._in_a = False
-        self._href = None
-        self._buf = []
+def _normalize_enc(enc: str | None) -> str | None:
+    if not enc:
+        return None
+    e = str(enc).strip().strip('"').strip("'")
+    if not e:
+        return None
+    e = e.lower()
+    if e in {"gb2312", "gbk"}:
+        return "gb18030"
+    if e in {"utf8"}:
+        return "utf-8"
+    return e
 
 
-def _fetch_html(url: str, *, timeout: int = 15, user_agent: str | None = None) -> str:
-    headers = {
-        "User-Agent": user_agent
-        or "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
+def _sniff_meta_charset(buf: bytes) -> str | None:
+    try:
+        head = buf[:8192].decode("ascii", errors="ignore").lower()
+    except Exception:
+        return None
+    m = _META_CHARSET_RE.search(head)
+    if m:
+        return _normalize_enc(m.group(1))
+    return None
 
-    content = resp.content or b""
 
-    def normalize_enc(enc: str | None) -> str | None:
-        if not enc:
-            return None
-        e = str(enc).strip().strip('"').strip("'")
-        if not e:
-            return None
-        e = e.lower()
-        if e in {"gb2312", "gbk"}:
-            return "gb18030"
-        if e in {"utf8"}:
-            return "utf-8"
-        return e
-
-    def sniff_meta_charset(buf: bytes) -> str | None:
-        try:
-            head = buf[:8192].decode("ascii", errors="ignore").lower()
-        except Exception:
-            return None
-        m = re.search(r"charset\s*=\s*([a-z0-9_\-]+)", head)
-        if m:
-            return normalize_enc(m.group(1))
-        return None
+def _decode_html(content: bytes, *, declared: str | None, apparent: Callable[[], str | None]) -> str:
+    """Decode a page body, trying cheap signals before charset detection.
+
+    ``apparent`` is only called (it runs chardet over the whole body) when
+    neither the BOM, the declared/meta charset nor UTF-8 decode cleanly.
+    """
+    for bom, enc in _BOMS:
+        if content.startswith(bom):
+            return content.decode(enc, errors="replace")
 
     # Prefer declared encoding when it's meaningful. Requests may default to
     # ISO-8859-1 for text/* without charset, which is wrong for many CN sites.
-    declared = normalize_enc(resp.encoding)
+    declared = _normalize_enc(declared)
     if declared and declared not in {"iso-8859-1", "ascii"}:
         try:
             return content.decode(declared, errors="replace")
         except Exception:
             pass
 
+    meta_enc = _sniff_meta_charset(content)
+    # Fast path: a strict decode that succeeds has no replacement chars, so
+    # there is nothing for the heuristic below to improve on.
+    strict_tried = dict.fromkeys([meta_enc or "utf-8", "utf-8"])
+    for enc in strict_tried:
+        try:
+            return content.decode(enc)
+        except (UnicodeDecodeError, LookupError):
+            continue
+
     candidates: list[str] = []
-    meta_enc = sniff_meta_charset(content)
     if meta_enc:
         candidates.append(meta_enc)
-    apparent = normalize_enc(getattr(resp, "apparent_encoding", None))
-    if apparent:
-        candidates.append(apparent)
+    apparent_enc = _normalize_enc(apparent())
+    if apparent_enc:
+        candidates.append(apparent_enc)
     # Common fallbacks.
     candidates.extend(["utf-8", "gb18030"])
+    candidates = list(dict.fromkeys(_normalize_enc(enc) or "utf-8" for enc in candidates))
+
+    # The remaining candidates get the same strict short-circuit; only when
+    # none of them is clean do we pay for replace-decoding and counting.
+    for enc in candidates:
+        if enc in strict_tried:
+            continue
+        try:
+            return content.decode(enc)
+        except (UnicodeDecodeError, LookupError):
+            continue
 
-    tried: set[str] = set()
     best: str | None = None
     best_score: int | None = None
     for enc in candidates:
-        enc = normalize_enc(enc) or "utf-8"
-        if enc in tried:
-            continue
-        tried.add(enc)
         try:
             text = content.decode(enc, errors="replace")
         except Exception:
@@ -126,46 +176,210 @@ def _fetch_html(url: str, *, timeout: int = 15, user_agent: str | None = None) -
         if best is None or (best_score is not None and score < best_score):
             best = text
             best_score = score
-            if score == 0:
-                break
 
     return best or content.decode("utf-8", errors="replace")
 
 
-def _extract_links(html: str, *, base_url: str) -> list[dict[str, str]]:
-    p = _AnchorParser()
-    p.feed(html)
-    out: list[dict[str, str]] = []
-    for a in p.anchors:
-        href = a.get("href", "")
-        title = a.get("title", "")
-        if not href or not title:
-            continue
-        href = urllib.parse.urljoin(base_url, href)
-        out.append({"title": title, "url": href})
-    return out
+def _cached_get(
+    namespace: str,
+    url: str,
+    *,
+    headers: Dict[str, str],
+    timeout: int,
+    read: Callable[[Any], Any],
+    stream: bool = False,
+    params: Dict[str, Any] | None = None,
+    fresh: float = _NET_CACHE_FRESH_SECONDS,
+    stale_on_error: bool = True,
+) -> Any:
+    """GET ``url`` through an on-disk cache with conditional revalidation.
+
+    ``read`` turns a 200 response into a JSON-serialisable value; that value
+    (not the raw body) is what gets cached. Fresh entries are served without
+    a request, older ones are revalidated via ETag/Last-Modified, and a stale
+    entry is returned if the network fails unless ``stale_on_error`` is False.
+    ``fresh`` is the no-request window in seconds.
+    """
+    name = urllib.parse.urlsplit(url).netloc or "_"
+    key = {"url": url, **(params or {})}
+    now = time.time()
+    # Many symbols share the same macro feeds within one run; serve those
+    # from memory before touching the disk entry.
+    memo_key = (namespace, url, tuple(sorted((params or {}).items())))
+    hit = _NET_MEMO.get(memo_key)
+    if hit is not None and now - hit[0] < fresh:
+        return hit[1]
+
+    entry = _NET_CACHE.get(namespace, name, key, ttl=_NET_CACHE_KEEP_SECONDS)
+    if entry and now - float(entry.get("fetched_at") or 0.0) < fresh:
+        _NET_MEMO[memo_key] = (float(entry["fetched_at"]), entry["value"])
+        return entry["value"]
+
+    headers = dict(headers)
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    try:
+        resp = get_session().get(url, headers=headers, timeout=timeout, stream=stream)
+        with resp:
+            if entry and resp.status_code == 304:
+                value = entry["value"]
+            else:
+                resp.raise_for_status()
+                value = read(resp)
+            etag = resp.headers.get("ETag") or (entry or {}).get("etag")
+            last_modified = resp.headers.get("Last-Modified") or (entry or {}).get("last_modified")
+    except Exception:
+        if entry and stale_on_error:
+            return entry["value"]
+        raise
+
+    _NET_CACHE.set(
+        namespace,
+        name,
+        key,
+        {"fetched_at": now, "etag": etag, "last_modified": last_modified, "value": value},
+    )
+    _NET_MEMO[memo_key] = (now, value)
+    return value
+
+
+def _read_html(resp: Any) -> str:
+    chunks = resp.iter_content(_READ_CHUNK)
+    first = next(chunks, b"")
+
+    # With a usable declared charset, decode while streaming so the raw
+    # body and its decoded copy are never both held in full.
+    declared = _normalize_enc(resp.encoding)
+    if declared and declared not in {"iso-8859-1", "ascii"} and not first.startswith(_BOM_PREFIXES):
+        try:
+            dec = codecs.getincrementaldecoder(declared)(errors="replace")
+        except LookupError:
+            dec = None
+        if dec is not None:
+            parts = [dec.decode(first)]
+            parts.extend(dec.decode(c) for c in chunks)
+            parts.append(dec.decode(b"", final=True))
+            return "".join(parts)
 
+    body = first + b"".join(chunks)
+    return _decode_html(body, declared=resp.encoding, apparent=lambda: _detect_encoding(body))
+
+
+def _detect_encoding(content: bytes) -> str | None:
+    # Same detector as Response.apparent_encoding, run on the bytes already
+    # read: a streamed response's .content is gone once iter_content drained it.
+    from requests.compat import chardet
+
+    if chardet is None:
+        return None
+    return chardet.detect(content)["encoding"]
+
+
+def _fetch_html(url: str, *, timeout: int = 15, user_agent: str | None = None) -> str:
+    headers = {
+        "User-Agent": user_agent or _DEFAULT_UA,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    }
+    # Web items are stamped with the run date, so a days-old page must not
+    # stand in for a failed fetch: it would surface old headlines as today's.
+    return _cached_get(
+        "html", url, headers=headers, timeout=timeout, read=_read_html, stream=True, stale_on_error=False
+    )
 
-def _match_keywords(title: str, symbol: Dict[str, Any]) -> bool:
-    t = (title or "").lower()
-    if not t:
-        return False
-    # Always allow if the title contains the symbol name.
-    name = str(symbol.get("name") or symbol.get("id") or "").strip().lower()
-    if name and name in t:
-        return True
-    kws = [str(k).strip().lower() for k in (symbol.get("keywords") or []) if str(k).strip()]
-    return any(k and k in t for k in kws)
+
+def _parallel_map(fn: Callable[[Any], Any], args: list[Any]) -> list[Any]:
+    """Map a blocking fetch over ``args`` on a small thread pool, preserving order."""
+    if len(args) <= 1:
+        return [fn(a) for a in args]
+    with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(args))) as ex:
+        return list(ex.map(fn, args))
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urllib.parse.urlsplit(url).netloc
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(_PER_HOST_LIMIT)
+    return slot
+
+
+def _fetch_pages(urls: list[str], *, timeout: int, user_agent: str | None) -> list[tuple[str, str | None]]:
+    """Fetch pages concurrently, preserving order. Failed URLs map to None.
+
+    At most ``_PER_HOST_LIMIT`` requests run against any one host at a time.
+    """
+
+    def _one(url: str) -> str | None:
+        try:
+            with _host_slot(url):
+                return _fetch_html(url, timeout=timeout, user_agent=user_agent)
+        except Exception:
+            return None
+
+    urls = list(urls)
+    return list(zip(urls, _parallel_map(_one, urls)))
+
+
+# Portal pages repeat the same relative hrefs (nav bars, topic lists) and
+# share a few base URLs, so joins are memoized.
+_urljoin = functools.lru_cache(maxsize=2048)(urllib.parse.urljoin)
+
+
+def _iter_links(html: str) -> Iterator[tuple[str, str]]:
+    """Lazily yield (cleaned title, raw href) pairs; consumers may stop early.
+
+    The href is left raw so it is only cleaned and resolved for the few
+    anchors that survive the title filters.
+    """
+    for href, text in _iter_anchors(html):
+        title = clean_text(text)
+        if title:
+            yield title, href
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _url_allow_re(wcfg: Dict[str, Any], default: re.Pattern[str]) -> re.Pattern[str]:
+    v = str(wcfg.get("url_allow", "") or "").strip()
+    return _compile_pattern(v) if v else default
+
+
+def _alternation(terms: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile literal terms into one alternation (a single C-level scan)."""
+    uniq = sorted({t for t in terms if t}, key=len, reverse=True)
+    if not uniq:
+        return None
+    return re.compile("|".join(re.escape(t) for t in uniq))
+
+
+@functools.lru_cache(maxsize=4096)
+def _title_norm(title: str) -> str:
+    """Cleaned, lower-cased headline used by topic matching."""
+    return clean_text(title).lower()
+
+
+@functools.lru_cache(maxsize=256)
+def _symbol_keyword_re(name: Any, keywords: tuple[Any, ...]) -> re.Pattern[str] | None:
+    return _alternation([str(name or "").strip().lower(), *(str(k).strip().lower() for k in keywords)])
 
 
 def _dedup_items(items: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
-    seen: set[str] = set()
+    # Titles/urls are clean_text'ed at ingestion, so the raw pair is the key.
+    seen: set[tuple[str, str]] = set()
+    seen_add = seen.add
     out: list[Dict[str, Any]] = []
     for it in items:
-        k = clean_text((it.get("url") or "") + "|" + (it.get("title") or ""))
-        if not k or k in seen:
+        k = (it.get("url") or "", it.get("title") or "")
+        # Items with neither url nor title carry nothing to show; skip them.
+        if k == ("", "") or k in seen:
             continue
-        seen.add(k)
+        seen_add(k)
         out.append(it)
     return out
 
@@ -240,6 +454,29 @@ def _get_news_weighting_params(cfg: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _rfc2822_date(s: str) -> _date | None:
+    try:
+        dt = parsedate_to_datetime(s)
+        if dt is None:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc).date()
+    except Exception:
+        return None
+
+
+def _iso_datetime_date(s: str) -> _date | None:
+    try:
+        dt2 = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        if dt2.tzinfo is None:
+            dt2 = dt2.replace(tzinfo=timezone.utc)
+        return dt2.astimezone(timezone.utc).date()
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_published_date(published_at: str) -> _date | None:
     s = (published_at or "").strip()
     if not s:
@@ -254,36 +491,28 @@ def _parse_published_date(published_at: str) -> _date | None:
     except Exception:
         pass
 
-    try:
-        dt = parsedate_to_datetime(s)
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc).date()
-    except Exception:
-        pass
+    # Dispatch on shape so the likely parser runs first.
+    if s[:4].isdigit():
+        return _iso_datetime_date(s) or _rfc2822_date(s)
+    return _rfc2822_date(s) or _iso_datetime_date(s)
+
 
+def _parse_target_date(date: str) -> _date | None:
     try:
-        dt2 = datetime.fromisoformat(s.replace("Z", "+00:00"))
-        if dt2.tzinfo is None:
-            dt2 = dt2.replace(tzinfo=timezone.utc)
-        return dt2.astimezone(timezone.utc).date()
+        return _date.fromisoformat(str(date))
     except Exception:
         return None
 
-def _compute_recency_weight(cfg: Dict[str, Any], *, published_at: str, date: str) -> tuple[float, int | None]:
-    params = _get_news_weighting_params(cfg)
+
+def _recency_weight(params: Dict[str, Any], target: _date | None, published_at: str) -> tuple[float, int | None]:
+    """Recency weight and age in days; params/target are resolved once per batch."""
+    if target is None:
+        return 1.0, None
     half_life_days = float(params["half_life_days"])
     min_weight = float(params["min_weight"])
     fresh_boost_days = int(params["fresh_boost_days"])
     fresh_boost = float(params["fresh_boost"])
 
-    try:
-        target = _date.fromisoformat(str(date))
-    except Exception:
-        return 1.0, None
-
     pub = _parse_published_date(published_at)
     if pub is None:
         # Unknown timestamp: keep, but do not let it dominate.
@@ -303,37 +532,46 @@ def _compute_recency_weight(cfg: Dict[str, Any], *, published_at: str, date: str
     return w, int(age_days)
 
 
+_RATE_MARKER_RE = _alternation(["利率", "rates", "rate ", "rate-", "rate", "加息", "降息", "升息"])
+_RATE_UP_RE = _alternation(["加息", "升息", "上调", "提高", "raise", "hike", "tighten"])
+_RATE_DOWN_RE = _alternation(["降息", "下调", "降低", "cut", "lower", "ease"])
+_FED_RE = _alternation(["美联储", "fed", "fomc"])
+_ECB_RE = _alternation(["欧洲央行", "ecb"])
+_PBOC_RE = _alternation(["人民银行", "央行", "pboc"])
+_TARIFF_RE = _alternation(["关税", "tariff"])
+_TARIFF_UP_RE = _alternation(["加征", "上调", "提高", "raise", "impose", "increase"])
+_TARIFF_DOWN_RE = _alternation(["取消", "下调", "降低", "reduce", "cut", "suspend", "roll back"])
+
+
 def _classify_supersede_topic(title: str) -> tuple[str, int] | None:
     """Classify a headline into (topic_key, direction).
 
     Only for a few macro policy-like topics where newer opposite actions
     can supersede older ones (e.g., rate hike -> later rate cut).
     """
-    t = clean_text(title).lower()
+    t = _title_norm(title or "")
     if not t:
         return None
 
     # Policy rate: many CN headlines only say "加息/降息" without "利率".
-    rate_markers = ["利率", "rates", "rate ", "rate-", "rate", "加息", "降息", "升息"]
-    has_rate = any(k in t for k in rate_markers)
-    if has_rate:
-        up = any(k in t for k in ["加息", "升息", "上调", "提高", "raise", "hike", "tighten"])
-        down = any(k in t for k in ["降息", "下调", "降低", "cut", "lower", "ease"])
+    if _RATE_MARKER_RE.search(t):
+        up = _RATE_UP_RE.search(t) is not None
+        down = _RATE_DOWN_RE.search(t) is not None
         if up ^ down:
             direction = 1 if up else -1
             entity = "rate"
-            if any(k in t for k in ["美联储", "fed", "fomc"]):
+            if _FED_RE.search(t):
                 entity = "fed"
-            elif any(k in t for k in ["欧洲央行", "ecb"]):
+            elif _ECB_RE.search(t):
                 entity = "ecb"
-            elif any(k in t for k in ["人民银行", "央行", "pboc"]):
+            elif _PBOC_RE.search(t):
                 entity = "pboc"
             return f"{entity}:policy_rate", direction
 
     # Tariff: require tariff keyword and directional cue
-    if any(k in t for k in ["关税", "tariff"]):
-        up = any(k in t for k in ["加征", "上调", "提高", "raise", "impose", "increase"])
-        down = any(k in t for k in ["取消", "下调", "降低", "reduce", "cut", "suspend", "roll back"])
+    if _TARIFF_RE.search(t):
+        up = _TARIFF_UP_RE.search(t) is not None
+        down = _TARIFF_DOWN_RE.search(t) is not None
         if up ^ down:
             direction = 1 if up else -1
             return "global:tariff", direction
@@ -341,17 +579,25 @@ def _classify_supersede_topic(title: str) -> tuple[str, int] | None:
     return None
 
 
-def _apply_supersede(cfg: Dict[str, Any], items: list[Dict[str, Any]], *, date: str) -> list[Dict[str, Any]]:
-    params = _get_news_weighting_params(cfg)
+def _apply_supersede(
+    cfg: Dict[str, Any],
+    items: list[Dict[str, Any]],
+    *,
+    date: str,
+    params: Dict[str, Any] | None = None,
+) -> list[Dict[str, Any]]:
+    if params is None:
+        params = _get_news_weighting_params(cfg)
     if not params.get("supersede_enabled", True):
         return items
 
     # Find the latest item per topic; if latest direction differs from an older one,
     # we consider the older one superseded and set its weight to 0.
-    latest: dict[str, dict[str, Any]] = {}
+    # Each item is classified once; the second pass only compares.
+    classified: list[tuple[int, str, int, _date]] = []
     latest_dir: dict[str, int] = {}
     latest_pub: dict[str, _date] = {}
-    for it in items:
+    for i, it in enumerate(items):
         cls = _classify_supersede_topic(str((it or {}).get("title") or ""))
         if not cls:
             continue
@@ -359,54 +605,61 @@ def _apply_supersede(cfg: Dict[str, Any], items: list[Dict[str, Any]], *, date:
         pub = _parse_published_date(str((it or {}).get("published_at") or ""))
         if pub is None:
             continue
+        classified.append((i, topic, direction, pub))
         prev = latest_pub.get(topic)
         if prev is None or pub > prev:
             latest_pub[topic] = pub
-            latest[topic] = it
             latest_dir[topic] = direction
 
-    if not latest_pub:
-        return items
+    superseded = {
+        i for i, topic, direction, pub in classified if pub < latest_pub[topic] and direction != latest_dir[topic]
+    }
+    # Items are the ranking pass's own copies, so mark them in place.
+    for i in superseded:
+        items[i]["weight"] = 0.0
+        items[i]["superseded"] = True
+    return items
 
-    out: list[Dict[str, Any]] = []
-    for it in items:
-        cls = _classify_supersede_topic(str((it or {}).get("title") or ""))
-        if not cls:
-            out.append(it)
-            continue
-        topic, direction = cls
-        pub = _parse_published_date(str((it or {}).get("published_at") or ""))
-        if pub is None:
-            out.append(it)
-            continue
-        latest_p = latest_pub.get(topic)
-        if latest_p and pub < latest_p and latest_dir.get(topic) is not None and direction != int(latest_dir[topic]):
-            it2 = {**it}
-            it2["weight"] = 0.0
-            it2["superseded"] = True
-            out.append(it2)
-            continue
-        out.append(it)
-    return out
 
+def _annotate_and_rank_items(
+    cfg: Dict[str, Any],
+    items: list[Dict[str, Any]],
+    *,
+    date: str,
+    max_items: int,
+    copy_items: bool = True,
+) -> list[Dict[str, Any]]:
+    """Weight, supersede and rank items.
 
-def _annotate_and_rank_items(cfg: Dict[str, Any], items: list[Dict[str, Any]], *, date: str, max_items: int) -> list[Dict[str, Any]]:
+    Pass ``copy_items=False`` when the caller owns freshly built dicts; they
+    are then annotated in place instead of being copied first.
+    """
     if not items:
         return []
     max_items = max(0, int(max_items))
     if max_items == 0:
         return []
 
+    # Resolve config and target date once, not per item.
+    params = _get_news_weighting_params(cfg)
+    target = _parse_target_date(date)
+    # Items often share a timestamp (web sources stamp the run date), so
+    # compute each distinct weight once.
+    by_pub: Dict[str, tuple[float, int | None]] = {}
     tmp: list[Dict[str, Any]] = []
     for it in items:
-        it2 = {**(it or {})}
-        w, age_days = _compute_recency_weight(cfg, published_at=str(it2.get("published_at") or ""), date=date)
+        it2 = {**(it or {})} if copy_items else it
+        pub = str(it2.get("published_at") or "")
+        wa = by_pub.get(pub)
+        if wa is None:
+            wa = by_pub[pub] = _recency_weight(params, target, pub)
+        w, age_days = wa
         it2["weight"] = float(it2.get("weight") or w)
         if age_days is not None:
             it2["age_days"] = int(age_days)
         tmp.append(it2)
 
-    tmp = _apply_supersede(cfg, tmp, date=date)
+    tmp = _apply_supersede(cfg, tmp, date=date, params=params)
 
     tmp = [it for it in tmp if float(it.get("weight") or 0.0) > 0.0]
 
@@ -420,31 +673,40 @@ def _annotate_and_rank_items(cfg: Dict[str, Any], items: list[Dict[str, Any]], *
         # Higher weight first; then newer first.
         return (-w, agei)
 
-    tmp.sort(key=_sort_key)
-    return tmp[:max_items]
+    # Same order as sorted(...)[:max_items], without sorting the whole list.
+    return heapq.nsmallest(max_items, tmp, key=_sort_key)
 
 
 def _web_items_from_links(
-    links: list[dict[str, str]],
+    links: Iterable[tuple[str, str]],
     *,
+    base_url: str,
     source: str,
     symbol: Dict[str, Any],
     max_items: int,
     date: str,
-    url_allow: str | None = None,
+    url_allow: re.Pattern[str] | None = None,
 ) -> list[Dict[str, Any]]:
+    # Portals emit thousands of anchors: resolve the matchers once.
+    # Links come from _iter_links: titles cleaned, hrefs still raw.
+    allow = url_allow.search if url_allow is not None else None
+    kw_re = _symbol_keyword_re(symbol.get("name") or symbol.get("id"), tuple(symbol.get("keywords") or ()))
+    if kw_re is None:
+        return []
+    kw_search = kw_re.search
     out: list[Dict[str, Any]] = []
-    allow_re = re.compile(url_allow) if url_allow else None
-    for it in links:
-        title = clean_text(it.get("title", ""))
-        url = clean_text(it.get("url", ""))
-        if not title or not url:
+    for title, href in links:
+        if len(title) < 8:
             continue
-        if allow_re and not allow_re.search(url):
+        # Most portal anchors don't mention the symbol, so the keyword test
+        # rejects far more than the URL filter does; run it first.
+        if kw_search(title.lower()) is None:
             continue
-        if len(title) < 8:
+        href = clean_text(href)
+        if not href:
             continue
-        if not _match_keywords(title, symbol):
+        url = _urljoin(base_url, href)
+        if allow is not None and allow(url) is None:
             continue
         out.append(
             {
@@ -465,15 +727,17 @@ def _fetch_news_jin10(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str, ma
     urls = wcfg.get("urls") or ["https://xnews.jin10.com/"]
     timeout = int(wcfg.get("timeout_seconds", 15) or 15)
     ua = str(wcfg.get("user_agent", "") or "").strip() or None
-    url_allow = str(wcfg.get("url_allow", r"xnews\\.jin10\\.com/(details|\d)") or r"xnews\\.jin10\\.com/")
+    url_allow = _url_allow_re(wcfg, _JIN10_ALLOW_RE)
     items: list[Dict[str, Any]] = []
-    for url in urls:
+    for url, html in _fetch_pages(urls, timeout=timeout, user_agent=ua):
+        if html is None:
+            continue
         try:
-            html = _fetch_html(url, timeout=timeout, user_agent=ua)
-            links = _extract_links(html, base_url=url)
+            # Streamed: parsing/cleaning stops once max_items links matched.
             items.extend(
                 _web_items_from_links(
-                    links,
+                    _iter_links(html),
+                    base_url=url,
                     source="金十数据",
                     symbol=symbol,
                     max_items=max_items,
@@ -485,7 +749,6 @@ def _fetch_news_jin10(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str, ma
             continue
         if len(items) >= max_items:
             break
-        time.sleep(0.2)
     return _dedup_items(items)[:max_items]
 
 
@@ -495,16 +758,18 @@ def _fetch_news_eastmoney(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str
     timeout = int(wcfg.get("timeout_seconds", 15) or 15)
     ua = str(wcfg.get("user_agent", "") or "").strip() or None
     # Keep only article links (avoid quote/contract links).
-    url_allow = str(wcfg.get("url_allow", r"eastmoney\\.com/a/\d{16,}\\.html") or r"eastmoney")
+    url_allow = _url_allow_re(wcfg, _EASTMONEY_ALLOW_RE)
 
     items: list[Dict[str, Any]] = []
-    for url in urls:
+    for url, html in _fetch_pages(urls, timeout=timeout, user_agent=ua):
+        if html is None:
+            continue
         try:
-            html = _fetch_html(url, timeout=timeout, user_agent=ua)
-            links = _extract_links(html, base_url=url)
+            # Streamed: parsing/cleaning stops once max_items links matched.
             items.extend(
                 _web_items_from_links(
-                    links,
+                    _iter_links(html),
+                    base_url=url,
                     source="东方财富期货",
                     symbol=symbol,
                     max_items=max_items,
@@ -516,7 +781,6 @@ def _fetch_news_eastmoney(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str
             continue
         if len(items) >= max_items:
             break
-        time.sleep(0.2)
     return _dedup_items(items)[:max_items]
 
 
@@ -525,16 +789,18 @@ def _fetch_news_qhrb(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str, max
     urls = wcfg.get("urls") or ["https://www.qhrb.com.cn/"]
     timeout = int(wcfg.get("timeout_seconds", 15) or 15)
     ua = str(wcfg.get("user_agent", "") or "").strip() or None
-    url_allow = str(wcfg.get("url_allow", r"qhrb\\.com\\.cn") or r"qhrb")
+    url_allow = _url_allow_re(wcfg, _QHRB_ALLOW_RE)
 
     items: list[Dict[str, Any]] = []
-    for url in urls:
+    for url, html in _fetch_pages(urls, timeout=timeout, user_agent=ua):
+        if html is None:
+            continue
         try:
-            html = _fetch_html(url, timeout=timeout, user_agent=ua)
-            links = _extract_links(html, base_url=url)
+            # Streamed: parsing/cleaning stops once max_items links matched.
             items.extend(
                 _web_items_from_links(
-                    links,
+                    _iter_links(html),
+                    base_url=url,
                     source="期货日报",
                     symbol=symbol,
                     max_items=max_items,
@@ -546,7 +812,6 @@ def _fetch_news_qhrb(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str, max
             continue
         if len(items) >= max_items:
             break
-        time.sleep(0.2)
     return _dedup_items(items)[:max_items]
 
 
@@ -554,15 +819,66 @@ def _parse_entry_source(title: str) -> str:
     # Google News RSS titles are often like: "<headline> - <publisher>".
     parts = [p.strip() for p in (title or "").rsplit(" - ", 1)]
     if len(parts) == 2 and parts[1]:
-        return parts[1]
+        # A handful of publishers repeat across every feed; share one string each.
+        return sys.intern(parts[1])
     return "Google News"
 
 
+@functools.lru_cache(maxsize=256)
 def _gnews_rss_url(query: str, *, hl: str, gl: str, ceid: str) -> str:
     q = urllib.parse.quote(query)
     return f"https://news.google.com/rss/search?q={q}&hl={hl}&gl={gl}&ceid={ceid}"
 
 
+def _parse_rss_items(body: bytes, *, limit: int) -> list[tuple[str, str, str]]:
+    """Extract (title, link, pubDate) from a plain RSS 2.0 body.
+
+    Google News feeds need nothing more, so this skips feedparser's
+    sanitizing/normalizing pipeline. Stops after ``limit`` items.
+    """
+    out: list[tuple[str, str, str]] = []
+    if limit <= 0:
+        return out
+    for _, elem in ET.iterparse(io.BytesIO(body), events=("end",)):
+        if elem.tag != "item":
+            continue
+        out.append((elem.findtext("title") or "", elem.findtext("link") or "", elem.findtext("pubDate") or ""))
+        elem.clear()
+        if len(out) >= limit:
+            break
+    return out
+
+
+def _feed_entries(feed: Any, *, limit: int) -> list[tuple[str, str, str]]:
+    return [
+        (
+            getattr(e, "title", ""),
+            getattr(e, "link", ""),
+            getattr(e, "published", "") or getattr(e, "updated", "") or "",
+        )
+        for e in (feed.entries or [])[:limit]
+    ]
+
+
+def _parse_feed_body(body: bytes, *, limit: int) -> list[tuple[str, str, str]]:
+    """Fast RSS path, falling back to feedparser on the same bytes (no refetch)."""
+    try:
+        return _parse_rss_items(body, limit=limit)
+    except Exception:
+        return _feed_entries(feedparser.parse(body), limit=limit)
+
+
+def _fetch_feed(url: str) -> Any:
+    """Download a feed over the pooled session and hand only the bytes to feedparser."""
+    try:
+        resp = get_session().get(url, headers={"User-Agent": _DEFAULT_UA}, timeout=15)
+        resp.raise_for_status()
+        body = resp.content
+    except Exception:
+        return feedparser.parse(url)
+    return feedparser.parse(body)
+
+
 def _fetch_gnews_rss(
     *,
     query: str,
@@ -570,20 +886,32 @@ def _fetch_gnews_rss(
     hl: str,
     gl: str,
     ceid: str,
+    ttl: float = _GNEWS_CACHE_TTL,
 ) -> List[Dict[str, Any]]:
     url = _gnews_rss_url(query, hl=hl, gl=gl, ceid=ceid)
-    feed = feedparser.parse(url)
+    limit = max_items * 3
+    try:
+        entries = _cached_get(
+            "gnews",
+            url,
+            headers={"User-Agent": _DEFAULT_UA},
+            timeout=15,
+            read=lambda resp: _parse_feed_body(resp.content, limit=limit),
+            params={"limit": limit},
+            fresh=ttl,
+        )
+    except Exception:
+        # Network failure with nothing cached: let feedparser try its own fetch.
+        entries = _feed_entries(feedparser.parse(url), limit=limit)
     out: List[Dict[str, Any]] = []
-    for e in (feed.entries or [])[: max_items * 3]:
-        title = clean_text(getattr(e, "title", ""))
-        link = clean_text(getattr(e, "link", ""))
-        published = getattr(e, "published", "") or getattr(e, "updated", "") or ""
+    for title, link, published in entries:
+        title = clean_text(title)
         if not title:
             continue
         out.append(
             {
                 "title": title,
-                "url": link,
+                "url": clean_text(link),
                 "source": _parse_entry_source(title),
                 "published_at": clean_text(published) or "",
                 "content": "",
@@ -594,6 +922,52 @@ def _fetch_gnews_rss(
     return out
 
 
+def _fetch_gnews_langs(gcfg: Dict[str, Any], *, query: str, max_items: int) -> list[List[Dict[str, Any]]]:
+    """Fetch the zh and/or en Google News feeds concurrently.
+
+    Results are returned in (zh, en) order so callers merge deterministically.
+    """
+    want_lang = str(gcfg.get("language", "both") or "both").lower()
+    try:
+        ttl = float(gcfg.get("cache_ttl", _GNEWS_CACHE_TTL))
+    except Exception:
+        ttl = float(_GNEWS_CACHE_TTL)
+    params: list[tuple[str, str, str]] = []
+    if want_lang in {"zh", "both", "cn", "zh-cn"}:
+        params.append(
+            (str(gcfg.get("zh_hl", "zh-CN")), str(gcfg.get("zh_gl", "CN")), str(gcfg.get("zh_ceid", "CN:zh-Hans")))
+        )
+    if want_lang in {"en", "both", "us", "en-us"}:
+        params.append((str(gcfg.get("en_hl", "en-US")), str(gcfg.get("en_gl", "US")), str(gcfg.get("en_ceid", "US:en"))))
+    if len(params) <= 1:
+        return [
+            _fetch_gnews_rss(query=query, max_items=max_items, hl=hl, gl=gl, ceid=ceid, ttl=ttl)
+            for hl, gl, ceid in params
+        ]
+    with ThreadPoolExecutor(max_workers=len(params)) as ex:
+        futs = [
+            ex.submit(_fetch_gnews_rss, query=query, max_items=max_items, hl=hl, gl=gl, ceid=ceid, ttl=ttl)
+            for hl, gl, ceid in params
+        ]
+        return [f.result() for f in futs]
+
+
+def _merge_gnews(arrays: Iterable[List[Dict[str, Any]]], *, limit: int) -> List[Dict[str, Any]]:
+    """Concatenate per-language results, unique on (url, title), up to ``limit``."""
+    items: List[Dict[str, Any]] = []
+    seen: set[tuple[str, str]] = set()
+    seen_add = seen.add
+    for it in itertools.chain.from_iterable(arrays):
+        k = (it.get("url") or "", it.get("title") or "")
+        if k in seen:
+            continue
+        seen_add(k)
+        items.append(it)
+        if len(items) >= limit:
+            break
+    return items
+
+
 def _fetch_global_gnews(cfg: Dict[str, Any], *, max_items: int) -> list[Dict[str, Any]]:
     gcfg = ((cfg.get("news", {}) or {}).get("gnews", {}) or {})
     glob = ((cfg.get("news", {}) or {}).get("global", {}) or {})
@@ -617,90 +991,88 @@ def _fetch_global_gnews(cfg: Dict[str, Any], *, max_items: int) -> list[Dict[str
             "中国 经济 数据",
         ]
 
-    want_lang = str(gcfg.get("language", "both") or "both").lower()
     query = " OR ".join([f'({t})' for t in terms[:8]])
 
-    items: list[Dict[str, Any]] = []
-    seen: set[str] = set()
-
-    def _add(arr: list[Dict[str, Any]]):
-        nonlocal items
-        for it in arr:
-            k = (it.get("title") or "") + "|" + (it.get("url") or "")
-            if k in seen:
-                continue
-            seen.add(k)
-            it = {**it}
-            it["source"] = it.get("source") or "Google News"
-            items.append(it)
-            if len(items) >= max_items:
-                return
-
-    if want_lang in {"zh", "both", "cn", "zh-cn"}:
-        hl = str(gcfg.get("zh_hl", "zh-CN"))
-        gl = str(gcfg.get("zh_gl", "CN"))
-        ceid = str(gcfg.get("zh_ceid", "CN:zh-Hans"))
-        _add(_fetch_gnews_rss(query=query, max_items=max_items, hl=hl, gl=gl, ceid=ceid))
-        if len(items) >= max_items:
-            return items[:max_items]
-
-    if want_lang in {"en", "both", "us", "en-us"}:
-        hl = str(gcfg.get("en_hl", "en-US"))
-        gl = str(gcfg.get("en_gl", "US"))
-        ceid = str(gcfg.get("en_ceid", "US:en"))
-        _add(_fetch_gnews_rss(query=query, max_items=max_items, hl=hl, gl=gl, ceid=ceid))
-
-    return items[:max_items]
+    items = _merge_gnews(_fetch_gnews_langs(gcfg, query=query, max_items=max_items), limit=max_items)
+    for it in items:
+        it["source"] = it.get("source") or "Google News"
+    return items
 
 
 def fetch_global_news(cfg: Dict[str, Any], *, date: str, max_items: int) -> list[Dict[str, Any]]:
     """Fetch macro news that should be shared across all symbols."""
+    # _fetch_global_gnews already drops duplicate (url, title) pairs.
     items = _fetch_global_gnews(cfg, max_items=max_items)
-    items = _dedup_items(items)
-    return _annotate_and_rank_items(cfg, items, date=date, max_items=max_items)
+    return _annotate_and_rank_items(cfg, items, date=date, max_items=max_items, copy_items=False)
+
+
+def _fetch_gnews_only(
+    cfg: Dict[str, Any],
+    symbol: Dict[str, Any],
+    date: str,
+    max_n: int,
+    include_global: bool = False,
+) -> List[Dict[str, Any]]:
+    news_cfg = cfg.get("news", {}) or {}
+    gcfg = news_cfg.get("gnews", {}) or {}
+    # Heuristic query: include the symbol name + a few keywords.
+    kws = list(symbol.get("keywords") or [])
+    base_terms = [symbol.get("name") or symbol.get("id")]
+    # Keep query short to avoid overly broad results.
+    for k in kws[:4]:
+        if k and k not in base_terms:
+            base_terms.append(k)
+    query = " ".join([t for t in base_terms if t])
+
+    # Merged uniquely on (url, title) here, so no extra dedup pass below.
+    items = _merge_gnews(_fetch_gnews_langs(gcfg, query=query, max_items=max_n), limit=max_n)
+    if len(items) >= max_n:
+        return _annotate_and_rank_items(cfg, items, date=date, max_items=max_n, copy_items=False)
+
+    # Optionally mix global macro news even in pure gnews mode.
+    if include_global:
+        global_cap = int(((news_cfg.get("global", {}) or {}).get("max_items", 0)) or 0)
+        if global_cap > 0:
+            try:
+                items = _dedup_items(_fetch_global_gnews(cfg, max_items=min(global_cap, max_n)) + items)
+            except Exception:
+                pass
+    return _annotate_and_rank_items(cfg, items, date=date, max_items=max_n, copy_items=False)
 
 
 def fetch_symbol_news(cfg: Dict[str, Any], symbol: Dict[str, Any], *, date: str, max_items: int) -> list[Dict[str, Any]]:
     """Fetch symbol-specific news (without global macro mixing)."""
+    if max_items <= 0:
+        return []
     provider = (cfg.get("news", {}) or {}).get("provider", "gnews")
     # For symbol-specific, treat "multi" as: gnews + web.
     if provider == "multi":
         provider = "gnews+web"
 
-    items: list[Dict[str, Any]] = []
+    sources: list[Callable[[], list[Dict[str, Any]]]] = []
 
     if provider in {"gnews", "gnews+web"}:
-        # Reuse existing gnews logic by calling this module's fetch_news with gnews,
-        # but disable global mixing by forcing global.max_items=0.
-        cfg2 = {
-            **cfg,
-            "news": {
-                **(cfg.get("news", {}) or {}),
-                "provider": "gnews",
-                "global": {**(((cfg.get("news", {}) or {}).get("global", {}) or {})), "max_items": 0},
-            },
-        }
-        try:
-            items.extend(fetch_news(cfg2, symbol, date))
-        except Exception:
-            pass
+        sources.append(functools.partial(_fetch_gnews_only, cfg, symbol, date, max_items))
 
     if provider in {"web", "gnews+web"}:
+        web_cap = max(3, max_items)
+        for fetch in (_fetch_news_jin10, _fetch_news_qhrb, _fetch_news_eastmoney):
+            sources.append(functools.partial(fetch, cfg, symbol, date, web_cap))
+
+    def _run(source: Callable[[], list[Dict[str, Any]]]) -> list[Dict[str, Any]]:
         try:
-            items.extend(_fetch_news_jin10(cfg, symbol, date, max(3, max_items)))
-        except Exception:
-            pass
-        try:
-            items.extend(_fetch_news_qhrb(cfg, symbol, date, max(3, max_items)))
-        except Exception:
-            pass
-        try:
-            items.extend(_fetch_news_eastmoney(cfg, symbol, date, max(3, max_items)))
+            return source()
         except Exception:
-            pass
+            return []
+
+    # Sources are independent network fetches: run them side by side and
+    # merge in the fixed order above so ranking ties stay deterministic.
+    items: list[Dict[str, Any]] = []
+    for arr in _parallel_map(_run, sources):
+        items.extend(arr)
 
     items = _dedup_items(items)
-    return _annotate_and_rank_items(cfg, items, date=date, max_items=max_items)
+    return _annotate_and_rank_items(cfg, items, date=date, max_items=max_items, copy_items=False)
 
 
 def fetch_news_bundle(cfg: Dict[str, Any], symbol: Dict[str, Any], *, date: str, max_items: int) -> Dict[str, Any]:
@@ -709,8 +1081,9 @@ def fetch_news_bundle(cfg: Dict[str, Any], symbol: Dict[str, Any], *, date: str,
     global_cap = max(0, min(global_cap, max_items))
     sym_cap = max_items
 
-    global_items = fetch_global_news(cfg, date=date, max_items=global_cap)
-    symbol_items = fetch_symbol_news(cfg, symbol, date=date, max_items=sym_cap)
+    # A zero cap means that side is unused: skip its network fetches entirely.
+    global_items = fetch_global_news(cfg, date=date, max_items=global_cap) if global_cap > 0 else []
+    symbol_items = fetch_symbol_news(cfg, symbol, date=date, max_items=sym_cap) if sym_cap > 0 else []
 
     merged: list[Dict[str, Any]] = []
     for it in global_items:
@@ -719,7 +1092,7 @@ def fetch_news_bundle(cfg: Dict[str, Any], symbol: Dict[str, Any], *, date: str,
         merged.append({**it, "scope": "symbol"})
 
     merged = _dedup_items(merged)
-    merged = _annotate_and_rank_items(cfg, merged, date=date, max_items=max_items)
+    merged = _annotate_and_rank_items(cfg, merged, date=date, max_items=max_items, copy_items=False)
     return {"global": global_items, "symbol": symbol_items, "merged": merged}
 
 
@@ -739,71 +1112,21 @@ def fetch_news(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str) -> List[D
         return fetch_symbol_news(cfg, symbol, date=date, max_items=max_n)
 
     if provider == "gnews":
-        gcfg = ((cfg.get("news", {}) or {}).get("gnews", {}) or {})
-        want_lang = str(gcfg.get("language", "both") or "both").lower()
-        # Heuristic query: include the symbol name + a few keywords.
-        kws = list(symbol.get("keywords") or [])
-        base_terms = [symbol.get("name") or symbol.get("id")]
-        # Keep query short to avoid overly broad results.
-        for k in kws[:4]:
-            if k and k not in base_terms:
-                base_terms.append(k)
-        query = " ".join([t for t in base_terms if t])
-
-        items: List[Dict[str, Any]] = []
-        seen = set()
-
-        if want_lang in {"zh", "both", "cn", "zh-cn"}:
-            hl = str(gcfg.get("zh_hl", "zh-CN"))
-            gl = str(gcfg.get("zh_gl", "CN"))
-            ceid = str(gcfg.get("zh_ceid", "CN:zh-Hans"))
-            for it in _fetch_gnews_rss(query=query, max_items=max_n, hl=hl, gl=gl, ceid=ceid):
-                k = (it.get("title") or "") + "|" + (it.get("url") or "")
-                if k in seen:
-                    continue
-                seen.add(k)
-                items.append(it)
-                if len(items) >= max_n:
-                    items = _dedup_items(items)
-                    return _annotate_and_rank_items(cfg, items, date=date, max_items=max_n)
-
-        if want_lang in {"en", "both", "us", "en-us"}:
-            hl = str(gcfg.get("en_hl", "en-US"))
-            gl = str(gcfg.get("en_gl", "US"))
-            ceid = str(gcfg.get("en_ceid", "US:en"))
-            for it in _fetch_gnews_rss(query=query, max_items=max_n, hl=hl, gl=gl, ceid=ceid):
-                k = (it.get("title") or "") + "|" + (it.get("url") or "")
-                if k in seen:
-                    continue
-                seen.add(k)
-                items.append(it)
-                if len(items) >= max_n:
-                    items = _dedup_items(items)
-                    return _annotate_and_rank_items(cfg, items, date=date, max_items=max_n)
-
-        # Optionally mix global macro news even in pure gnews mode.
-        global_cap = int((((cfg.get("news", {}) or {}).get("global", {}) or {}).get("max_items", 0)) or 0)
-        if global_cap > 0:
-            try:
-                items = _dedup_items(_fetch_global_gnews(cfg, max_items=min(global_cap, max_n)) + items)
-            except Exception:
-                pass
-        items = _dedup_items(items)
-        return _annotate_and_rank_items(cfg, items, date=date, max_items=max_n)
+        return _fetch_gnews_only(cfg, symbol, date, max_n, include_global=True)
 
     if provider == "rss":
         urls = ((cfg.get("news", {}) or {}).get("rss", {}) or {}).get("urls", []) or []
         if urls:
             items: List[Dict[str, Any]] = []
-            for url in urls:
-                feed = feedparser.parse(url)
+            for feed in _parallel_map(_fetch_feed, list(urls)):
+                # One feed title per feed, not per entry.
+                source = clean_text(getattr(feed.feed, "title", "RSS"))
                 for e in feed.entries[: max_n * 2]:
                     title = clean_text(getattr(e, "title", ""))
-                    link = clean_text(getattr(e, "link", ""))
-                    published = getattr(e, "published", "") or getattr(e, "updated", "") or ""
-                    source = clean_text(getattr(feed.feed, "title", "RSS"))
                     if not title:
                         continue
+                    link = clean_text(getattr(e, "link", ""))
+                    published = getattr(e, "published", "") or getattr(e, "updated", "") or ""
                     items.append(
                         {
                             "title": title,
@@ -814,7 +1137,7 @@ def fetch_news(cfg: Dict[str, Any], symbol: Dict[str, Any], date: str) -> List[D
                         }
                     )
             items = _dedup_items(items)
-            return _annotate_and_rank_items(cfg, items, date=date, max_items=max_n)
+            return _annotate_and_rank_items(cfg, items, date=date, max_items=max_n, copy_items=False)
 
         # Explicitly do not fallback to mock when RSS isn't configured.
         return []
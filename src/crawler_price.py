@@ -1,11 +1,27 @@
 from __future__ import annotations
 
+import functools
 import logging
+import operator
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List
 
-import requests
+from .cache import CACHE_ROOT, FileCache
+from .http_client import get_session
+from .utils import try_import_akshare
+
+# Upper bound on concurrent Tushare requests (matches the pooled session's
+# per-host connection budget with room to spare).
+_TUSHARE_WORKERS = 8
+
+_CACHE = FileCache(CACHE_ROOT / "tushare")
+_CACHE_TTL_PAST = 90 * 24 * 3600
+
+# Related symbols in one run often map to the same monthly contracts; keep the
+# parsed series per (ts_code, start, end) for the life of the process.
+_SERIES_MEMO: dict[tuple[str, str, str], list[Dict[str, Any]]] = {}
 
 
 def fetch_kline(cfg: Dict[str, Any], symbol: Dict[str, Any], end_date: str, days: int) -> List[Dict[str, Any]]:
@@ -47,6 +63,63 @@ def fetch_kline(cfg: Dict[str, Any], symbol: Dict[str, Any], end_date: str, days
     return []
 
 
+@functools.lru_cache(maxsize=256)
+def _compact_window(end_date: str, days: int) -> tuple[str, str]:
+    """(start, end) as YYYYMMDD; shared by every symbol of a run."""
+    end_dt = date.fromisoformat(end_date)
+    # 留足自然日以覆盖交易日缺口
+    start_dt = end_dt - timedelta(days=days * 3)
+    return start_dt.strftime("%Y%m%d"), end_dt.strftime("%Y%m%d")
+
+
+def _normalize_day(raw: str) -> str:
+    # common formats: YYYY-MM-DD, YYYY/MM/DD, YYYYMMDD, datetime
+    s = raw.split(" ")[0].replace("/", "-")
+    if len(s) == 8 and s.isdigit():
+        s = f"{s[0:4]}-{s[4:6]}-{s[6:8]}"
+    return s if len(s) == 10 else ""
+
+
+def _to_float(v: Any) -> float:
+    if v is None:
+        return 0.0
+    if isinstance(v, (int, float)):
+        return float(v)
+    if not isinstance(v, str):
+        # numpy scalars, Decimal, ...: convert directly instead of via str().
+        try:
+            f = float(v)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return 0.0 if f != f else f
+    s = str(v).strip().replace(",", "")
+    if s in {"", "nan", "None"}:
+        return 0.0
+    return float(s)
+
+
+def _to_int(v: Any) -> int:
+    return int(_to_float(v))
+
+
+def _pick_column(cols: Dict[str, list[Any]], names: tuple[str, ...], n_rows: int) -> list[Any]:
+    """Values of the first alias column, falling through per row like ``a or b``."""
+    present = [cols[n] for n in names if n in cols]
+    if not present:
+        return [None] * n_rows
+    if len(present) == 1:
+        return present[0]
+    out: list[Any] = []
+    for vals in zip(*present):
+        v = vals[0]
+        for v in vals:
+            if v:
+                break
+        out.append(v)
+    return out
+
+
 def fetch_kline_akshare(cfg: Dict[str, Any], symbol: Dict[str, Any], *, end_date: str, days: int) -> List[Dict[str, Any]]:
     asset = str(symbol.get("asset") or "futures").strip().lower() or "futures"
 
@@ -57,15 +130,11 @@ def fetch_kline_akshare(cfg: Dict[str, Any], symbol: Dict[str, Any], *, end_date
     if not ak_symbol:
         raise RuntimeError(f"missing akshare_symbol for symbol {symbol.get('id')}")
 
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-    start_dt = end_dt - timedelta(days=days * 3)
-    start_compact = start_dt.strftime("%Y%m%d")
-    end_compact = end_dt.strftime("%Y%m%d")
+    start_compact, end_compact = _compact_window(end_date, days)
 
-    try:
-        import akshare as ak  # type: ignore
-    except Exception as e:
-        raise RuntimeError(f"akshare not available: {e}")
+    ak = try_import_akshare()
+    if ak is None:
+        raise RuntimeError("akshare not available")
 
     if asset == "stock":
         df = ak.stock_zh_a_hist(
@@ -80,53 +149,69 @@ def fetch_kline_akshare(cfg: Dict[str, Any], symbol: Dict[str, Any], *, end_date
     if df is None:
         raise RuntimeError("empty akshare response")
 
-    # Avoid importing pandas explicitly; rely on DataFrame API.
+    # Avoid importing pandas explicitly; rely on DataFrame API. Pull whole
+    # columns instead of to_dict("records"), which boxes every cell into a
+    # fresh per-row dict.
     try:
-        records = df.to_dict("records")
+        cols = {str(c): df[c].tolist() for c in df.columns}
+        n_rows = len(df)
     except Exception as e:
         raise RuntimeError(f"unexpected akshare dataframe: {e}")
-    if not records:
+    if not n_rows:
         raise RuntimeError("empty futures_main_sina")
 
-    def _to_float(v: Any) -> float:
-        if v is None:
-            return 0.0
-        if isinstance(v, (int, float)):
-            return float(v)
-        s = str(v).strip().replace(",", "")
-        if s in {"", "nan", "None"}:
-            return 0.0
-        return float(s)
-
-    def _to_int(v: Any) -> int:
-        return int(_to_float(v))
+    def col(*names: str) -> list[Any]:
+        return _pick_column(cols, names, n_rows)
 
+    dates = col("日期", "date", "Date", "时间")
     out: List[Dict[str, Any]] = []
-    for r in records:
-        date_raw = r.get("日期") or r.get("date") or r.get("Date") or r.get("时间")
+    if asset == "stock":
+        # stock_zh_a_hist 常见字段：日期, 开盘, 收盘, 最高, 最低, 成交量, 成交额, 振幅, 换手率, 涨跌幅...
+        rows = zip(
+            dates,
+            col("开盘", "开盘价", "open"),
+            col("最高", "最高价", "high"),
+            col("最低", "最低价", "low"),
+            col("收盘", "收盘价", "close"),
+            col("成交量", "volume", "vol"),
+            col("成交额", "amount"),
+            col("换手率", "turnover"),
+            col("振幅", "amplitude"),
+        )
+    else:
+        rows = zip(
+            dates,
+            col("开盘价", "open"),
+            col("最高价", "high"),
+            col("最低价", "low"),
+            col("收盘价", "close"),
+            col("成交量", "volume"),
+            col("持仓量", "open_interest", "oi"),
+        )
+    for date_raw, *vals in rows:
         if not date_raw:
             continue
         date_iso = str(date_raw)
-        # common formats: YYYY-MM-DD, YYYY/MM/DD, datetime
-        date_iso = date_iso.split(" ")[0].replace("/", "-")
-        if len(date_iso) == 8 and date_iso.isdigit():
-            date_iso = f"{date_iso[0:4]}-{date_iso[4:6]}-{date_iso[6:8]}"
-        if len(date_iso) != 10:
-            continue
+        # AKShare mostly hands back date objects (str -> YYYY-MM-DD); only
+        # normalize the other shapes.
+        if not (len(date_iso) == 10 and date_iso[4] == "-" and date_iso[7] == "-"):
+            date_iso = _normalize_day(date_iso)
+            if not date_iso:
+                continue
 
         if asset == "stock":
-            # stock_zh_a_hist 常见字段：日期, 开盘, 收盘, 最高, 最低, 成交量, 成交额, 振幅, 换手率, 涨跌幅...
-            amount = _to_float(r.get("成交额") or r.get("amount"))
-            turnover_rate = _to_float(r.get("换手率") or r.get("turnover"))
-            amplitude = _to_float(r.get("振幅") or r.get("amplitude"))
+            o, h, lo, c, vol, amount_raw, turnover_raw, amplitude_raw = vals
+            amount = _to_float(amount_raw)
+            turnover_rate = _to_float(turnover_raw)
+            amplitude = _to_float(amplitude_raw)
             out.append(
                 {
                     "date": date_iso,
-                    "open": _to_float(r.get("开盘") or r.get("开盘价") or r.get("open")),
-                    "high": _to_float(r.get("最高") or r.get("最高价") or r.get("high")),
-                    "low": _to_float(r.get("最低") or r.get("最低价") or r.get("low")),
-                    "close": _to_float(r.get("收盘") or r.get("收盘价") or r.get("close")),
-                    "volume": _to_int(r.get("成交量") or r.get("volume") or r.get("vol")),
+                    "open": _to_float(o),
+                    "high": _to_float(h),
+                    "low": _to_float(lo),
+                    "close": _to_float(c),
+                    "volume": _to_int(vol),
                     "amount": None if amount == 0.0 else amount,
                     "turnover_rate": None if turnover_rate == 0.0 else turnover_rate,
                     "amplitude": None if amplitude == 0.0 else amplitude,
@@ -134,34 +219,48 @@ def fetch_kline_akshare(cfg: Dict[str, Any], symbol: Dict[str, Any], *, end_date
                 }
             )
         else:
+            o, h, lo, c, vol, oi = vals
             out.append(
                 {
                     "date": date_iso,
-                    "open": _to_float(r.get("开盘价") or r.get("open")),
-                    "high": _to_float(r.get("最高价") or r.get("high")),
-                    "low": _to_float(r.get("最低价") or r.get("low")),
-                    "close": _to_float(r.get("收盘价") or r.get("close")),
-                    "volume": _to_int(r.get("成交量") or r.get("volume")),
-                    "open_interest": _to_int(r.get("持仓量") or r.get("open_interest") or r.get("oi")),
+                    "open": _to_float(o),
+                    "high": _to_float(h),
+                    "low": _to_float(lo),
+                    "close": _to_float(c),
+                    "volume": _to_int(vol),
+                    "open_interest": _to_int(oi),
                 }
             )
 
-    out.sort(key=lambda x: x["date"])
+    out.sort(key=operator.itemgetter("date"))
     # Keep within range and last N trading bars
     out = [x for x in out if x["date"] <= end_date]
     return out[-days:]
 
 
 def _tushare_post(token: str, api_name: str, params: Dict[str, Any], fields: str) -> Dict[str, Any]:
+    # Ranges that end before today are settled history: serve them from disk.
+    # The token is deliberately not part of the key.
+    end = str(params.get("end_date") or "")
+    cacheable = bool(end) and end < datetime.now().strftime("%Y%m%d")
+    key = {"params": params, "fields": fields}
+    name = f"{api_name}_{params.get('ts_code') or ''}"
+    if cacheable:
+        hit = _CACHE.get(api_name, name, key, ttl=_CACHE_TTL_PAST)
+        if hit is not None:
+            return hit
+
     url = "https://api.tushare.pro"
     payload = {"api_name": api_name, "token": token, "params": params, "fields": fields}
-    resp = requests.post(url, json=payload, timeout=30)
+    resp = get_session().post(url, json=payload, timeout=30)
     resp.raise_for_status()
     data = resp.json()
     # success: {"code":0,"msg":"","data":{...}}
     if not isinstance(data, dict) or data.get("code", 0) != 0:
         msg = data.get("msg") if isinstance(data, dict) else "unknown"
         raise RuntimeError(f"tushare error: {msg}")
+    if cacheable and (data.get("data") or {}).get("items"):
+        _CACHE.set(api_name, name, key, data)
     return data
 
 
@@ -176,11 +275,7 @@ def fetch_kline_tushare(cfg: Dict[str, Any], symbol: Dict[str, Any], *, end_date
     if not ts_code:
         raise RuntimeError(f"missing tushare_ts_code for symbol {symbol.get('id')}")
 
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-    # 留足自然日以覆盖交易日缺口
-    start_dt = end_dt - timedelta(days=days * 3)
-    start_date = start_dt.strftime("%Y%m%d")
-    end_date_compact = end_dt.strftime("%Y%m%d")
+    start_date, end_date_compact = _compact_window(end_date, days)
 
     # 主力连续：先取连续合约->月合约的每日映射，再拼接月合约日线
     mapping = _fetch_fut_mapping(
@@ -227,7 +322,7 @@ def _fetch_fut_mapping(token: str, *, ts_code: str, start_date: str, end_date: s
                 out.append({"trade_date": td, "mapping_ts_code": mp})
         if out:
             # 通常是倒序，统一为升序
-            out.sort(key=lambda x: x["trade_date"])
+            out.sort(key=operator.itemgetter("trade_date"))
             return out
     return []
 
@@ -250,6 +345,11 @@ def _candidate_continuous_codes(ts_code: str) -> list[str]:
 
 
 def _fetch_fut_daily_series(token: str, *, ts_code: str, start_date: str, end_date: str) -> list[Dict[str, Any]]:
+    memo_key = (ts_code, start_date, end_date)
+    hit = _SERIES_MEMO.get(memo_key)
+    if hit is not None:
+        return list(hit)
+
     raw = _tushare_post(
         token,
         "fut_daily",
@@ -260,31 +360,34 @@ def _fetch_fut_daily_series(token: str, *, ts_code: str, start_date: str, end_da
     if not fields or not items:
         raise RuntimeError("empty fut_daily")
     idx = {name: i for i, name in enumerate(fields)}
-
-    def g(row: list[Any], name: str, default: Any = None) -> Any:
-        i = idx.get(name)
-        return default if i is None else row[i]
+    # Resolve column positions once; a missing column reads a padded None.
+    names = ("trade_date", "open", "high", "low", "close", "vol", "oi")
+    pick = operator.itemgetter(*(idx.get(name, len(fields)) for name in names))
+    pad = any(name not in idx for name in names)
 
     out: list[Dict[str, Any]] = []
     for row in items:
-        td = str(g(row, "trade_date", ""))
+        td, o, h, lo, c, vol, oi = pick([*row, None] if pad else row)
+        td = str(td or "")
         if len(td) != 8:
             continue
-        date_iso = f"{td[0:4]}-{td[4:6]}-{td[6:8]}"
         out.append(
             {
-                "date": date_iso,
-                "open": float(g(row, "open", 0.0) or 0.0),
-                "high": float(g(row, "high", 0.0) or 0.0),
-                "low": float(g(row, "low", 0.0) or 0.0),
-                "close": float(g(row, "close", 0.0) or 0.0),
-                "volume": int(float(g(row, "vol", 0.0) or 0.0)),
-                "open_interest": int(float(g(row, "oi", 0.0) or 0.0)),
+                "date": f"{td[0:4]}-{td[4:6]}-{td[6:8]}",
+                "open": float(o or 0.0),
+                "high": float(h or 0.0),
+                "low": float(lo or 0.0),
+                "close": float(c or 0.0),
+                "volume": int(float(vol or 0.0)),
+                "open_interest": int(float(oi or 0.0)),
             }
         )
 
-    out.sort(key=lambda x: x["date"])
-    return out
+    # Tushare returns newest first; timsort turns that single descending run
+    # around in one linear pass.
+    out.sort(key=operator.itemgetter("date"))
+    _SERIES_MEMO[memo_key] = out
+    return list(out)
 
 
 def _build_continuous_from_mapping(
@@ -305,18 +408,26 @@ def _build_continuous_from_mapping(
             seen.add(c)
             unique_contracts.append(c)
 
+    def _fetch(c: str) -> list[Dict[str, Any]]:
+        return _fetch_fut_daily_series(token, ts_code=c, start_date=start_date, end_date=end_date)
+
+    # One round trip per monthly contract: overlap them instead of paying the
+    # latency serially. Any failure still propagates, as before.
     daily_by_contract: dict[str, dict[str, Dict[str, Any]]] = {}
-    for c in unique_contracts:
-        series = _fetch_fut_daily_series(token, ts_code=c, start_date=start_date, end_date=end_date)
-        daily_by_contract[c] = {x["date"].replace("-", ""): x for x in series}
+    with ThreadPoolExecutor(max_workers=max(1, min(_TUSHARE_WORKERS, len(unique_contracts)))) as pool:
+        for c, series in zip(unique_contracts, pool.map(_fetch, unique_contracts)):
+            daily_by_contract[c] = {x["date"]: x for x in series}
 
+    # Convert the `days` wanted trade dates to ISO rather than every bar of
+    # every contract series to compact form.
     out: list[Dict[str, Any]] = []
     for m in wanted:
         td = m["trade_date"]
+        td = f"{td[0:4]}-{td[4:6]}-{td[6:8]}"
         c = m["mapping_ts_code"]
         bar = (daily_by_contract.get(c) or {}).get(td)
         if not bar:
             continue
         out.append(bar)
-    out.sort(key=lambda x: x["date"])
+    # wanted is ascending by trade_date, so out already is too.
     return out
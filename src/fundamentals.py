@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Dict, List
@@ -7,6 +9,85 @@ from typing import Any, Dict, List
 from .utils import ensure_dir, read_json, write_json
 
 
+@functools.lru_cache(maxsize=4096)
+def _iso_day(s: str) -> str:
+    n = len(s)
+    if not n:
+        return ""
+    # Common shapes first: "YYYY-MM-DD" (optionally followed by a time) and
+    # "YYYYMMDD" are sliced directly.
+    if n == 10 or (n > 10 and s[10] == " "):
+        head = s[:10]
+        if head[4] == "-" and head[7] == "-" and " " not in head and "/" not in head:
+            return head
+    elif n == 8 and s.isdigit():
+        return f"{s[0:4]}-{s[4:6]}-{s[6:8]}"
+    s = s.split(" ")[0].replace("/", "-")
+    if len(s) == 8 and s.isdigit():
+        return f"{s[0:4]}-{s[4:6]}-{s[6:8]}"
+    return s
+
+
+def _iso_date(d: Any) -> str:
+    # The same handful of dates recur on every upsert; cache the string work.
+    if d is None:
+        return ""
+    return _iso_day(str(d).strip())
+
+
+def _num(v: Any) -> float | None:
+    if v is None:
+        return None
+    if isinstance(v, (int, float)):
+        x = float(v)
+        if x != x:  # NaN
+            return None
+        return x
+    s = str(v).strip().replace(",", "")
+    if s in {"", "nan", "None"}:
+        return None
+    try:
+        x = float(s)
+        if x != x:
+            return None
+        return x
+    except Exception:
+        return None
+
+
+# positions_rank column aliases, in priority order.
+_LONG_KEYS = ("long", "多单", "多头", "多单持仓", "多头持仓", "多头持仓量", "多头持仓(手)")
+_SHORT_KEYS = ("short", "空单", "空头", "空单持仓", "空头持仓", "空头持仓量", "空头持仓(手)")
+_NET_KEYS = ("net", "净持仓", "净持仓量", "净持仓(手)")
+_VOL_KEYS = ("vol", "volume", "成交量", "成交", "成交量(手)")
+
+
+def _sum_keys(rows: List[Dict[str, Any]], *key_groups: tuple[str, ...]) -> list[float | None]:
+    """Per group, sum each row's first parseable alias; None if no row had one.
+
+    All groups are summed in one pass, and aliases absent from every row are
+    dropped up front, so rows are not probed for columns the table lacks.
+    """
+    present = set().union(*rows)
+    groups = [[k for k in keys if k in present] for keys in key_groups]
+    totals = [0.0] * len(groups)
+    found = [False] * len(groups)
+    for r in rows:
+        get = r.get
+        for j, keys in enumerate(groups):
+            for k in keys:
+                v = get(k)
+                if v is None:
+                    continue
+                v = _num(v)
+                if v is None:
+                    continue
+                totals[j] += v
+                found[j] = True
+                break
+    return [t if f else None for t, f in zip(totals, found)]
+
+
 def fundamentals_signals_for_llm(extras: Dict[str, Any] | None) -> Dict[str, Any]:
     """Build a compact fundamentals snapshot for LLM prompts.
 
@@ -20,36 +101,6 @@ def fundamentals_signals_for_llm(extras: Dict[str, Any] | None) -> Dict[str, Any
     if not isinstance(modules, dict):
         modules = {}
 
-    def _iso_date(d: Any) -> str:
-        if d is None:
-            return ""
-        s = str(d).strip()
-        if not s:
-            return ""
-        s = s.split(" ")[0].replace("/", "-")
-        if len(s) == 8 and s.isdigit():
-            return f"{s[0:4]}-{s[4:6]}-{s[6:8]}"
-        return s
-
-    def _num(v: Any) -> float | None:
-        if v is None:
-            return None
-        if isinstance(v, (int, float)):
-            x = float(v)
-            if x != x:  # NaN
-                return None
-            return x
-        s = str(v).strip().replace(",", "")
-        if s in {"", "nan", "None"}:
-            return None
-        try:
-            x = float(s)
-            if x != x:
-                return None
-            return x
-        except Exception:
-            return None
-
     asof = _iso_date(extras.get("asof"))
     out: Dict[str, Any] = {"status": "ok", "asof": asof, "signals": {}}
 
@@ -101,23 +152,7 @@ def fundamentals_signals_for_llm(extras: Dict[str, Any] | None) -> Dict[str, Any
         if isinstance(items, list) and items:
             rows = [x for x in items if isinstance(x, dict)]
 
-            def _sum_keys(keys: List[str]) -> float | None:
-                total = 0.0
-                found = False
-                for r in rows:
-                    for k in keys:
-                        if k in r and r.get(k) is not None:
-                            v = _num(r.get(k))
-                            if v is None:
-                                continue
-                            total += float(v)
-                            found = True
-                            break
-                return total if found else None
-
-            long_v = _sum_keys(["long", "多单", "多头", "多单持仓", "多头持仓", "多头持仓量", "多头持仓(手)"])
-            short_v = _sum_keys(["short", "空单", "空头", "空单持仓", "空头持仓", "空头持仓量", "空头持仓(手)"])
-            net_v = _sum_keys(["net", "净持仓", "净持仓量", "净持仓(手)"])
+            long_v, short_v, net_v = _sum_keys(rows, _LONG_KEYS, _SHORT_KEYS, _NET_KEYS)
             if net_v is None and (long_v is not None) and (short_v is not None):
                 net_v = float(long_v) - float(short_v)
 
@@ -134,6 +169,43 @@ def fundamentals_signals_for_llm(extras: Dict[str, Any] | None) -> Dict[str, Any
     return out
 
 
+def _take_series(obj: Any) -> List[Dict[str, Any]]:
+    if isinstance(obj, dict) and isinstance(obj.get("series"), list):
+        return [x for x in obj.get("series") if isinstance(x, dict)]
+    return []
+
+
+def _upsert_by_date(series: List[Dict[str, Any]], rec: Dict[str, Any], *, max_points: int) -> List[Dict[str, Any]]:
+    d = _iso_date(rec.get("date"))
+    if not d:
+        return series
+    # Series are only ever written by this function, so they are already
+    # unique and sorted by ISO date: locate the slot instead of re-sorting.
+    dates = [str(x.get("date") or "") for x in series]
+    i = bisect.bisect_left(dates, d)
+    out = list(series)
+    # Build exactly one merged record; the input series is left unmodified.
+    hit = i < len(dates) and dates[i] == d
+    rec2 = {**out[i], **rec} if hit else {**rec}
+    rec2["date"] = d
+    if hit:
+        out[i] = rec2
+    else:
+        out.insert(i, rec2)
+    return out[-max_points:]
+
+
+def _summarize_last(series: List[Dict[str, Any]], *keys: str) -> str | None:
+    if not series:
+        return None
+    last = series[-1]
+    parts = []
+    for k in keys:
+        if k in last and last.get(k) is not None:
+            parts.append(f"{k}={last.get(k)}")
+    return " · ".join(parts) if parts else None
+
+
 def update_fundamentals(
     *,
     data_dir: Path,
@@ -166,62 +238,7 @@ def update_fundamentals(
     prev = read_json(out_path, default=None)
     if not isinstance(prev, dict):
         prev = {}
-
-    def _take_series(obj: Any) -> List[Dict[str, Any]]:
-        if isinstance(obj, dict) and isinstance(obj.get("series"), list):
-            return [x for x in obj.get("series") if isinstance(x, dict)]
-        return []
-
-    def _iso_date(d: Any) -> str:
-        if d is None:
-            return ""
-        s = str(d).strip()
-        if not s:
-            return ""
-        s = s.split(" ")[0].replace("/", "-")
-        if len(s) == 8 and s.isdigit():
-            return f"{s[0:4]}-{s[4:6]}-{s[6:8]}"
-        return s
-
-    def _num(v: Any) -> float | None:
-        if v is None:
-            return None
-        if isinstance(v, (int, float)):
-            x = float(v)
-            if x != x:  # NaN
-                return None
-            return x
-        s = str(v).strip().replace(",", "")
-        if s in {"", "nan", "None"}:
-            return None
-        try:
-            x = float(s)
-            if x != x:
-                return None
-            return x
-        except Exception:
-            return None
-
-    def _upsert_by_date(series: List[Dict[str, Any]], rec: Dict[str, Any]) -> List[Dict[str, Any]]:
-        d = _iso_date(rec.get("date"))
-        if not d:
-            return series
-        rec2 = {**rec, "date": d}
-        merged: Dict[str, Dict[str, Any]] = {str(_iso_date(x.get("date"))): x for x in series if _iso_date(x.get("date"))}
-        old = merged.get(d) or {}
-        merged[d] = {**old, **rec2}
-        out = sorted(merged.values(), key=lambda x: str(x.get("date") or ""))
-        return out[-max_points:]
-
-    def _summarize_last(series: List[Dict[str, Any]], *keys: str) -> str | None:
-        if not series:
-            return None
-        last = series[-1]
-        parts = []
-        for k in keys:
-            if k in last and last.get(k) is not None:
-                parts.append(f"{k}={last.get(k)}")
-        return " · ".join(parts) if parts else None
+    # prev is a dict from here on; _take_series tolerates missing/odd sections.
 
     # inventory: replace with latest available series from module (already a time series)
     inv_mod = modules.get("inventory") or {}
@@ -244,11 +261,10 @@ def update_fundamentals(
         inv_series.sort(key=lambda x: x["date"])
         inv_series = inv_series[-max_points:]
     else:
-        inv_series = _take_series((prev.get("inventory") if isinstance(prev, dict) else None) or {})
+        inv_series = _take_series(prev.get("inventory"))
 
     # spot_basis: append daily
-    basis_prev = (prev.get("spot_basis") or {}) if isinstance(prev, dict) else {}
-    basis_series = _take_series(basis_prev)
+    basis_series = _take_series(prev.get("spot_basis"))
     basis_mod = modules.get("spot_basis") or {}
     if isinstance(basis_mod, dict) and basis_mod.get("status") == "ok":
         items = basis_mod.get("items")
@@ -265,11 +281,11 @@ def update_fundamentals(
                         "dom_contract": r0.get("dom_contract"),
                         "dom_contract_price": _num(r0.get("dom_contract_price")),
                     },
+                    max_points=max_points,
                 )
 
     # roll_yield: append daily
-    ry_prev = (prev.get("roll_yield") or {}) if isinstance(prev, dict) else {}
-    ry_series = _take_series(ry_prev)
+    ry_series = _take_series(prev.get("roll_yield"))
     ry_mod = modules.get("roll_yield") or {}
     if isinstance(ry_mod, dict) and ry_mod.get("status") == "ok":
         items = ry_mod.get("items")
@@ -284,11 +300,11 @@ def update_fundamentals(
                         "near_by": r0.get("near_by"),
                         "deferred": r0.get("deferred"),
                     },
+                    max_points=max_points,
                 )
 
     # positions_rank: compute a compact daily summary + keep a small preview for latest day
-    pos_prev = (prev.get("positions_rank") or {}) if isinstance(prev, dict) else {}
-    pos_series = _take_series(pos_prev)
+    pos_series = _take_series(prev.get("positions_rank"))
     pos_preview: List[Dict[str, Any]] = []
 
     pos_mod = modules.get("positions_rank") or {}
@@ -296,29 +312,10 @@ def update_fundamentals(
         items = pos_mod.get("items")
         if isinstance(items, list) and items:
             # Keep a tiny preview (first 10 rows) for front-end inspection.
-            for it in items[:10]:
-                if isinstance(it, dict):
-                    pos_preview.append(it)
-
-            def _sum_keys(rows: List[Dict[str, Any]], keys: List[str]) -> float | None:
-                total = 0.0
-                found = False
-                for r in rows:
-                    for k in keys:
-                        if k in r and r.get(k) is not None:
-                            v = _num(r.get(k))
-                            if v is None:
-                                continue
-                            total += float(v)
-                            found = True
-                            break
-                return total if found else None
+            pos_preview = [it for it in items[:10] if isinstance(it, dict)]
 
             rows = [x for x in items if isinstance(x, dict)]
-            long_v = _sum_keys(rows, ["long", "多单", "多头", "多单持仓", "多头持仓", "多头持仓量", "多头持仓(手)"])
-            short_v = _sum_keys(rows, ["short", "空单", "空头", "空单持仓", "空头持仓", "空头持仓量", "空头持仓(手)"])
-            net_v = _sum_keys(rows, ["net", "净持仓", "净持仓量", "净持仓(手)"])
-            vol_v = _sum_keys(rows, ["vol", "volume", "成交量", "成交", "成交量(手)"])
+            long_v, short_v, net_v, vol_v = _sum_keys(rows, _LONG_KEYS, _SHORT_KEYS, _NET_KEYS, _VOL_KEYS)
             if net_v is None and (long_v is not None) and (short_v is not None):
                 net_v = float(long_v) - float(short_v)
 
@@ -340,6 +337,7 @@ def update_fundamentals(
                         "volume": None if vol_v is None else round(float(vol_v), 2),
                         "rows": len(rows),
                     },
+                    max_points=max_points,
                 )
 
     # Assemble output
@@ -1,14 +1,113 @@
 from __future__ import annotations
 
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
 from .aggregator import compute_corr20
+from .cache import CACHE_ROOT
 from .utils import copy_file, ensure_dir, read_json, write_json, write_text
 
+_SITE_WORKERS = 8
+
+# updated_at/date -> cache-busting token: "2026-01-02 10:30" -> "20260102T1030".
+_BUILD_VERSION_TABLE = str.maketrans({"-": None, ":": None, "/": None, " ": "T"})
+
+
+@functools.lru_cache(maxsize=8)
+def _get_env(root_dir: Path) -> Any:
+    # One Environment per templates root: compiled templates stay in its cache
+    # across build_site calls. Templates don't change while the process runs.
+    # Jinja2 is imported here so commands that never build the site skip it.
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    # Compiled template bytecode also persists across runs; entries are keyed
+    # by a checksum of the template source, so edits invalidate them.
+    bytecode_dir = ensure_dir(CACHE_ROOT / "jinja")
+    return Environment(
+        loader=FileSystemLoader(str(root_dir / "templates")),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir)),
+    )
+
+
+def _build_symbol(
+    sym: Dict[str, Any],
+    *,
+    data_dir: Path,
+    docs_dir: Path,
+    detail_tpl: Any,
+    detail_ctx: Dict[str, Any],
+    updated_at: Any,
+    global_latest_date: str,
+    today_payloads: Dict[str, Any],
+) -> None:
+    sym_id = sym["id"]
+    sym_name = sym["name"]
+    history = read_json(data_dir / "symbols" / sym_id / "history.json", default={"symbol": sym, "days": []})
+    days = history.get("days") or []
+    corr20 = compute_corr20(days)
+
+    # Prefer loading today's payload (even if market closed) so the detail
+    # page can display fresh news; price may be marked stale.
+    latest_day_payload = None
+    if global_latest_date:
+        latest_day_payload = today_payloads.get(sym_id)
+    latest_date_for_symbol = global_latest_date if latest_day_payload else days[-1]["date"] if days else ""
+    if latest_day_payload:
+        latest_is_stale = bool(
+            latest_day_payload.get("is_stale") or (latest_day_payload.get("price") or {}).get("is_stale")
+        )
+    else:
+        latest_is_stale = False
+    meta = {
+        "symbol": {"id": sym_id, "name": sym_name},
+        "updated_at": updated_at,
+        "corr20": round(float(corr20), 3),
+        "days": days,
+        "latest_date": latest_date_for_symbol,
+        "latest_is_stale": latest_is_stale,
+    }
+
+    sym_api_dir = docs_dir / "api" / "symbols" / sym_id
+    ensure_dir(sym_api_dir / "days")
+    write_json(sym_api_dir / "index.json", meta)
+
+    # fundamentals dataset (optional)
+    fundamentals_src = data_dir / "symbols" / sym_id / "fundamentals.json"
+    if fundamentals_src.exists():
+        copy_file(fundamentals_src, sym_api_dir / "fundamentals.json")
+
+    # daily payloads (for calendar/news). Source day files are written by
+    # write_json already, so a byte copy matches a parse + re-dump.
+    src_days_dir = data_dir / "symbols" / sym_id / "days"
+    dst_days_dir = sym_api_dir / "days"
+    for d in days:
+        name = f"{d['date']}.json"
+        # copy_file leaves copies whose bytes already match untouched.
+        try:
+            copy_file(src_days_dir / name, dst_days_dir / name)
+        except FileNotFoundError:
+            pass
+
+    # Also copy today's payload even if it's not a trading day (not in history).
+    if global_latest_date and latest_day_payload:
+        write_json(sym_api_dir / "days" / f"{global_latest_date}.json", latest_day_payload)
+
+    export_src = data_dir / "exports" / f"{sym_id}.csv"
+    if export_src.exists():
+        copy_file(export_src, docs_dir / "api" / "exports" / f"{sym_id}.csv")
+
+    sym_asset = str(sym.get("asset") or "futures")
+    detail_html = detail_tpl.render(
+        {**detail_ctx, "symbol": {"id": sym_id, "name": sym_name, "asset": sym_asset}}
+    )
+    write_text(docs_dir / "s" / f"{sym_id}.html", detail_html)
+
 
 def build_site(cfg: Dict[str, Any], *, root_dir: Path) -> None:
     data_dir = root_dir / "data"
@@ -17,10 +116,7 @@ def build_site(cfg: Dict[str, Any], *, root_dir: Path) -> None:
     ensure_dir(docs_dir)
     write_text(docs_dir / ".nojekyll", "")
 
-    env = Environment(
-        loader=FileSystemLoader(str(root_dir / "templates")),
-        autoescape=select_autoescape(["html", "xml"]),
-    )
+    env = _get_env(root_dir)
     site_cfg = cfg.get("site", {}) or {}
     raw_base_path = str(site_cfg.get("base_path") or "").strip()
     # Default to relative paths so the site works both at domain root and under
@@ -37,12 +133,7 @@ def build_site(cfg: Dict[str, Any], *, root_dir: Path) -> None:
     latest = read_json(data_dir / "latest.json", default={"symbols": [], "date": "", "updated_at": ""})
 
     raw_build_version = str(latest.get("updated_at") or latest.get("date") or "").strip()
-    build_version = (
-        raw_build_version.replace("-", "")
-        .replace(":", "")
-        .replace(" ", "T")
-        .replace("/", "")
-    )
+    build_version = raw_build_version.translate(_BUILD_VERSION_TABLE)
 
     index_tpl = env.get_template("index.html.j2")
 
@@ -52,8 +143,11 @@ def build_site(cfg: Dict[str, Any], *, root_dir: Path) -> None:
     # Also extract macro_summary from the first available symbol payload.
     macro_summary = None
     global_latest_date = str(latest.get("date") or "")
+    symbols = latest.get("symbols") or []
+    # Parsed day payloads for global_latest_date, reused by the detail loop.
+    today_payloads: Dict[str, Any] = {}
     if global_latest_date:
-        for sym in latest.get("symbols", []) or []:
+        for sym in symbols:
             sym_id = sym.get("id")
             if not sym_id:
                 continue
@@ -61,6 +155,7 @@ def build_site(cfg: Dict[str, Any], *, root_dir: Path) -> None:
                 data_dir / "symbols" / sym_id / "days" / f"{global_latest_date}.json",
                 default=None,
             )
+            today_payloads[sym_id] = payload
             if not payload:
                 continue
 
@@ -144,60 +239,17 @@ def build_site(cfg: Dict[str, Any], *, root_dir: Path) -> None:
     copy_file(root_dir / "static" / "app.js", docs_dir / "static" / "app.js")
     copy_file(root_dir / "static" / "styles.css", docs_dir / "static" / "styles.css")
 
-    for sym in latest.get("symbols", []) or []:
-        sym_id = sym["id"]
-        sym_name = sym["name"]
-        history = read_json(data_dir / "symbols" / sym_id / "history.json", default={"symbol": sym, "days": []})
-        corr20 = compute_corr20(history.get("days", []) or [])
-
-        # Prefer loading today's payload (even if market closed) so the detail
-        # page can display fresh news; price may be marked stale.
-        latest_day_payload = None
-        if global_latest_date:
-            latest_day_payload = read_json(
-                data_dir / "symbols" / sym_id / "days" / f"{global_latest_date}.json",
-                default=None,
-            )
-        latest_date_for_symbol = global_latest_date if latest_day_payload else (history.get("days", []) or [])[-1]["date"] if (history.get("days") or []) else ""
-        latest_is_stale = bool((latest_day_payload or {}).get("is_stale") or (((latest_day_payload or {}).get("price") or {}).get("is_stale")))
-        meta = {
-            "symbol": {"id": sym_id, "name": sym_name},
-            "updated_at": latest.get("updated_at", ""),
-            "corr20": round(float(corr20), 3),
-            "days": history.get("days", []) or [],
-            "latest_date": latest_date_for_symbol,
-            "latest_is_stale": latest_is_stale,
-        }
-
-        sym_api_dir = docs_dir / "api" / "symbols" / sym_id
-        ensure_dir(sym_api_dir / "days")
-        write_json(sym_api_dir / "index.json", meta)
-
-        # fundamentals dataset (optional)
-        fundamentals_src = data_dir / "symbols" / sym_id / "fundamentals.json"
-        if fundamentals_src.exists():
-            copy_file(fundamentals_src, sym_api_dir / "fundamentals.json")
-
-        # daily payloads (for calendar/news)
-        for d in meta["days"]:
-            date = d["date"]
-            day_payload = read_json(data_dir / "symbols" / sym_id / "days" / f"{date}.json", default=None)
-            if day_payload:
-                write_json(sym_api_dir / "days" / f"{date}.json", day_payload)
-
-        # Also copy today's payload even if it's not a trading day (not in history).
-        if global_latest_date and latest_day_payload:
-            write_json(sym_api_dir / "days" / f"{global_latest_date}.json", latest_day_payload)
-
-        export_src = data_dir / "exports" / f"{sym_id}.csv"
-        if export_src.exists():
-            copy_file(export_src, docs_dir / "api" / "exports" / f"{sym_id}.csv")
-
-        sym_asset = str(sym.get("asset") or "futures")
-        detail_html = detail_tpl.render(
-            site=site_cfg,
-            base_path=base_path_detail,
-            symbol={"id": sym_id, "name": sym_name, "asset": sym_asset},
-            build_version=build_version,
+    if symbols:
+        build_one = functools.partial(
+            _build_symbol,
+            data_dir=data_dir,
+            docs_dir=docs_dir,
+            detail_tpl=detail_tpl,
+            detail_ctx={"site": site_cfg, "base_path": base_path_detail, "build_version": build_version},
+            updated_at=latest.get("updated_at", ""),
+            global_latest_date=global_latest_date,
+            today_payloads=today_payloads,
         )
-        write_text(docs_dir / "s" / f"{sym_id}.html", detail_html)
+        # Per-symbol work is file I/O plus a render; symbols share no outputs.
+        with ThreadPoolExecutor(max_workers=min(_SITE_WORKERS, len(symbols))) as ex:
+            list(ex.map(build_one, symbols))
@@ -1,14 +1,42 @@
 from __future__ import annotations
 
+import filecmp
 import json
 import logging
 import os
+import shutil
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
-import yaml
+
+_AKSHARE: Any = None
+_AKSHARE_RESOLVED = False
+_AKSHARE_LOCK = threading.Lock()
+
+
+def try_import_akshare() -> Any | None:
+    """Return the akshare module, or None if it is not installed.
+
+    AKShare is slow to import, so the outcome (including a failed import) is
+    resolved once per process and reused.
+    """
+    global _AKSHARE, _AKSHARE_RESOLVED
+    if _AKSHARE_RESOLVED:
+        return _AKSHARE
+    with _AKSHARE_LOCK:
+        if not _AKSHARE_RESOLVED:
+            try:
+                import akshare as ak  # type: ignore
+
+                _AKSHARE = ak
+            except Exception as e:
+                logging.info("AKShare not available: %s", e)
+                _AKSHARE = None
+            _AKSHARE_RESOLVED = True
+    return _AKSHARE
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -19,43 +47,96 @@ def setup_logging(level: str = "INFO") -> None:
 
 
 def load_yaml(path: str | Path) -> Dict[str, Any]:
+    import yaml
+
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f) or {}
 
 
+# Directories already created in this process; nothing here deletes them.
+_ENSURED_DIRS: set = set()
+
+
 def ensure_dir(path: str | Path) -> Path:
     p = Path(path)
+    key = str(p)
+    if key in _ENSURED_DIRS:
+        return p
     p.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(key)
     return p
 
 
 def read_json(path: str | Path, default: Any) -> Any:
-    p = Path(path)
-    if not p.exists():
+    # Read raw bytes and let json.loads decode them: skips the text-mode
+    # wrapper, and the open() doubles as the existence check.
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         return default
-    with open(p, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(raw)
+
+
+def _replace_bytes(p: Path, data: bytes) -> None:
+    # One write into a sibling temp file, then an atomic rename: readers never
+    # see a half-written file and a failure leaves the old one intact.
+    tmp = p.with_name(f".{p.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _unchanged(p: Path, data: bytes) -> bool:
+    # True when p already holds exactly these bytes; rebuilds then leave the
+    # file (and its mtime) alone. A size mismatch avoids reading it at all.
+    try:
+        if p.stat().st_size != len(data):
+            return False
+        with open(p, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
 
 
 def write_json(path: str | Path, data: Any) -> None:
     p = Path(path)
     ensure_dir(p.parent)
-    with open(p, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Encode up front (json.dump issues one small write per token).
+    raw = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    if _unchanged(p, raw):
+        return
+    _replace_bytes(p, raw)
 
 
 def write_text(path: str | Path, text: str) -> None:
     p = Path(path)
     ensure_dir(p.parent)
-    with open(p, "w", encoding="utf-8") as f:
-        f.write(text)
+    raw = text.encode("utf-8")
+    if _unchanged(p, raw):
+        return
+    _replace_bytes(p, raw)
 
 
 def copy_file(src: str | Path, dst: str | Path) -> None:
     src_p = Path(src)
     dst_p = Path(dst)
     ensure_dir(dst_p.parent)
-    dst_p.write_bytes(src_p.read_bytes())
+    # filecmp bails out on a size mismatch and otherwise compares in chunks;
+    # copyfile lets the kernel move the data (sendfile/copy_file_range).
+    try:
+        if filecmp.cmp(src_p, dst_p, shallow=False):
+            return
+    except OSError:
+        pass
+    shutil.copyfile(src_p, dst_p)
 
 
 def today_in_tz(tz_name: str) -> datetime: